@@ -9,6 +9,7 @@ import logging
 from pathlib import Path
 
 from src.fact_check_agent.fact_check_agent import FactCheckAgent, get_fact_check_agent
+from src.fact_check_agent.fact_checker import configure_event_loop
 
 # Setup logging
 logging.basicConfig(
@@ -32,6 +33,7 @@ async def main():
 
     args = parser.parse_args()
 
+    agent = None
     try:
         agent = get_fact_check_agent()
 
@@ -79,6 +81,9 @@ async def main():
     except Exception as e:
         logger.error(f"Error: {str(e)}")
         print(f"Error: {str(e)}")
+    finally:
+        if agent is not None:
+            await agent.aclose()
 
 
 async def interactive_mode(agent: FactCheckAgent, user_id: str):
@@ -187,5 +192,6 @@ async def interactive_mode(agent: FactCheckAgent, user_id: str):
 
 
 if __name__ == "__main__":
+    configure_event_loop()
     asyncio.run(main())
 
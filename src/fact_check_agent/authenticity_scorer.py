@@ -8,6 +8,8 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
 
+import numpy as np
+
 from .config import SCORING_WEIGHTS
 
 logger = logging.getLogger(__name__)
@@ -32,6 +34,26 @@ class ScoringBreakdown:
     authenticity_level: AuthenticityLevel
     confidence_interval: Tuple[float, float]
     explanation: str
+    
+    def as_verification_dict(self, status: str) -> Dict[str, Any]:
+        """Verification summary in the shape used by analysis reports"""
+        return {
+            "status": status,
+            "authenticity_score": self.final_score,
+            "authenticity_level": self.authenticity_level.value,
+            "confidence_interval": self.confidence_interval,
+            "explanation": self.explanation,
+        }
+    
+    def as_breakdown_dict(self) -> Dict[str, float]:
+        """Component scores in the shape used by analysis reports"""
+        return {
+            "source_credibility": self.source_credibility_score,
+            "cross_reference": self.cross_reference_score,
+            "evidence_quality": self.evidence_quality_score,
+            "publication_date": self.publication_date_score,
+            "expert_consensus": self.expert_consensus_score,
+        }
 
 class AuthenticityScorer:
     """Advanced authenticity scoring system"""
@@ -40,6 +62,15 @@ class AuthenticityScorer:
         """Initialize the authenticity scorer"""
         self.weights = SCORING_WEIGHTS
         
+        # Component weights in the order _calculate_component_scores returns them
+        self._weight_vector = np.array([
+            self.weights['source_credibility'],
+            self.weights['cross_reference_consistency'],
+            self.weights['evidence_quality'],
+            self.weights['publication_date_relevance'],
+            self.weights['expert_consensus'],
+        ])
+        
         # Source credibility ratings (expanded)
         self.source_credibility_db = {
             # Government and Official Sources
@@ -134,22 +165,14 @@ class AuthenticityScorer:
         logger.info(f"Calculating authenticity score for {claim_type} claim")
         
         # Calculate individual scoring components
-        source_credibility_score = self._calculate_source_credibility_score(
-            sources, claim_type
-        )
-        
-        cross_reference_score = self._calculate_cross_reference_score(
-            sources, evidence, contradictions
-        )
-        
-        evidence_quality_score = self._calculate_evidence_quality_score(
-            evidence, contradictions, claim_text
-        )
-        
-        publication_date_score = self._calculate_publication_date_score(sources)
-        
-        expert_consensus_score = self._calculate_expert_consensus_score(
-            sources, evidence, contradictions, claim_type
+        (
+            source_credibility_score,
+            cross_reference_score,
+            evidence_quality_score,
+            publication_date_score,
+            expert_consensus_score,
+        ) = components = self._calculate_component_scores(
+            claim_text, claim_type, sources, evidence, contradictions
         )
         
         # Calculate weighted final score
@@ -162,13 +185,7 @@ class AuthenticityScorer:
         )
         
         # **CRITICAL FIX**: Apply severe penalty for numerical contradictions
-        numerical_contradiction_penalty = 0.0
-        for contra in contradictions:
-            if contra.get('contradiction_type') == 'numerical_contradiction':
-                # Numerical contradictions (wrong IDs, numbers) should severely impact score
-                # The more credible the source, the bigger the penalty
-                source_credibility = contra.get('source_credibility', 0.5)
-                numerical_contradiction_penalty += 0.4 * source_credibility  # Up to 0.4 penalty per numerical contradiction
+        numerical_contradiction_penalty = self._calculate_numerical_contradiction_penalty(contradictions)
         
         # Apply the numerical contradiction penalty
         final_score -= numerical_contradiction_penalty
@@ -180,6 +197,95 @@ class AuthenticityScorer:
         # Ensure score is within bounds
         final_score = max(0.0, min(1.0, final_score))
         
+        return self._build_scoring_breakdown(
+            components, final_score, sources, evidence, contradictions
+        )
+    
+    def calculate_authenticity_scores_batch(
+        self,
+        items: List[Dict[str, Any]]
+    ) -> List[ScoringBreakdown]:
+        """
+        Calculate authenticity scores for many claims in one call
+        
+        Args:
+            items: One dict per claim holding the keyword arguments of
+                calculate_authenticity_score
+            
+        Returns:
+            ScoringBreakdowns in the same order as items
+        """
+        if not items:
+            return []
+        
+        logger.info(f"Calculating authenticity scores for {len(items)} claims")
+        
+        # One row of component scores per claim, combined with array ops
+        components = np.array([
+            self._calculate_component_scores(
+                item['claim_text'], item['claim_type'], item['sources'],
+                item['evidence'], item['contradictions']
+            )
+            for item in items
+        ])
+        penalties = np.fromiter(
+            (self._calculate_numerical_contradiction_penalty(item['contradictions']) for item in items),
+            dtype=float,
+            count=len(items)
+        )
+        
+        final_scores = components @ self._weight_vector - penalties
+        final_scores = np.where(penalties > 0, np.minimum(final_scores, 0.55), final_scores)
+        final_scores = np.clip(final_scores, 0.0, 1.0)
+        
+        return [
+            self._build_scoring_breakdown(
+                row, final_score, item['sources'], item['evidence'], item['contradictions']
+            )
+            for item, row, final_score in zip(items, components.tolist(), final_scores.tolist())
+        ]
+    
+    def _calculate_component_scores(
+        self,
+        claim_text: str,
+        claim_type: str,
+        sources: List[Dict[str, Any]],
+        evidence: List[Dict[str, Any]],
+        contradictions: List[Dict[str, Any]]
+    ) -> Tuple[float, float, float, float, float]:
+        """Calculate the five weighted scoring components for a claim"""
+        return (
+            self._calculate_source_credibility_score(sources, claim_type),
+            self._calculate_cross_reference_score(sources, evidence, contradictions),
+            self._calculate_evidence_quality_score(evidence, contradictions, claim_text),
+            self._calculate_publication_date_score(sources),
+            self._calculate_expert_consensus_score(sources, evidence, contradictions, claim_type),
+        )
+    
+    def _calculate_numerical_contradiction_penalty(
+        self,
+        contradictions: List[Dict[str, Any]]
+    ) -> float:
+        """Calculate the score penalty for numerical contradictions"""
+        numerical_contradiction_penalty = 0.0
+        for contra in contradictions:
+            if contra.get('contradiction_type') == 'numerical_contradiction':
+                # Numerical contradictions (wrong IDs, numbers) should severely impact score
+                # The more credible the source, the bigger the penalty
+                source_credibility = contra.get('source_credibility', 0.5)
+                numerical_contradiction_penalty += 0.4 * source_credibility  # Up to 0.4 penalty per numerical contradiction
+        
+        return numerical_contradiction_penalty
+    
+    def _build_scoring_breakdown(
+        self,
+        components: Tuple[float, float, float, float, float],
+        final_score: float,
+        sources: List[Dict[str, Any]],
+        evidence: List[Dict[str, Any]],
+        contradictions: List[Dict[str, Any]]
+    ) -> ScoringBreakdown:
+        """Assemble a ScoringBreakdown from component and final scores"""
         # Determine authenticity level
         authenticity_level = self._get_authenticity_level(final_score)
         
@@ -193,6 +299,14 @@ class AuthenticityScorer:
             final_score, authenticity_level, sources, evidence, contradictions
         )
         
+        (
+            source_credibility_score,
+            cross_reference_score,
+            evidence_quality_score,
+            publication_date_score,
+            expert_consensus_score,
+        ) = components
+        
         return ScoringBreakdown(
             source_credibility_score=source_credibility_score,
             cross_reference_score=cross_reference_score,
@@ -5,7 +5,7 @@ import re
 import json
 import logging
 from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from enum import Enum
 
 import vertexai
@@ -17,6 +17,9 @@ from .checkpoint_monitor import TimedCheckpoint
 
 logger = logging.getLogger(__name__)
 
+# Largest text sent to Gemini in a single extraction prompt
+MAX_CHUNK_SIZE = 16000
+
 class ClaimType(Enum):
     """Types of claims that can be fact-checked"""
     POLITICAL = "political"
@@ -40,6 +43,26 @@ class Claim:
     keywords: List[str]
     sources_to_check: List[str]
     priority: int  # 1 (highest) to 5 (lowest)
+    entity_texts: List[str] = field(init=False, repr=False)
+    entity_texts_lower: Tuple[str, ...] = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        """Cache entity texts once for the scoring and matching hot paths"""
+        self.entity_texts = [
+            e["text"] for e in self.entities if isinstance(e, dict) and "text" in e
+        ]
+        self.entity_texts_lower = tuple(text.lower() for text in self.entity_texts if text)
+    
+    def as_report_dict(self) -> Dict[str, Any]:
+        """Claim fields in the shape used by analysis reports"""
+        return {
+            "text": self.text,
+            "type": self.claim_type.value,
+            "confidence": self.confidence,
+            "priority": self.priority,
+            "entities": self.entities,
+            "keywords": self.keywords,
+        }
 
 class ClaimExtractor:
     """Extracts and classifies factual claims from text using Gemini"""
@@ -81,7 +104,7 @@ class ClaimExtractor:
         logger.info(f"🧠 Extracting claims from text ({len(text)} characters)")
         
         # Check if text is too long and needs chunking
-        max_chunk_size = 16000
+        max_chunk_size = MAX_CHUNK_SIZE
         if len(text) <= max_chunk_size:
             # Process normally for smaller texts
             return self._extract_claims_from_chunk(text)
@@ -101,7 +124,7 @@ class ClaimExtractor:
         Returns:
             Combined list of extracted claims from all chunks
         """
-        all_claims = []
+        chunk_results = []
         
         try:
             # Split text into smart chunks (try to break at sentence boundaries)
@@ -118,24 +141,16 @@ class ClaimExtractor:
                     with TimedCheckpoint("chunk_processing", {"chunk_index": i, "chunk_size": len(chunk)}) as cp:
                         chunk_claims = self._extract_claims_from_chunk(chunk)
                     
-                    # Adjust sentence indices to account for previous chunks
-                    for claim in chunk_claims:
-                        claim.sentence_index += i * 100  # Offset by chunk number
-                    
-                    all_claims.extend(chunk_claims)
+                    chunk_results.append(chunk_claims)
                     logger.info(f"✅ Chunk {i+1}: Extracted {len(chunk_claims)} claims")
                     
                 except Exception as e:
                     logger.warning(f"❌ Failed to process chunk {i+1}: {str(e)}")
-                    # Continue with next chunk
+                    # Keep chunk numbering aligned with the text
+                    chunk_results.append([])
                     continue
             
-            # Deduplicate and merge similar claims
-            with TimedCheckpoint("claim_deduplication", {"total_claims": len(all_claims)}) as cp:
-                final_claims = self._deduplicate_claims(all_claims)
-            
-            # Sort by priority and confidence
-            final_claims.sort(key=lambda x: (x.priority, -x.confidence))
+            final_claims = self.merge_chunk_claims(chunk_results)
             
             logger.info(f"✅ Completed chunked extraction: {len(final_claims)} claims from {len(chunks)} chunks")
             return final_claims
@@ -146,6 +161,31 @@ class ClaimExtractor:
             first_chunk = text[:max_chunk_size]
             return self._fallback_extraction(first_chunk)
     
+    def merge_chunk_claims(self, chunk_results: List[List[Claim]]) -> List[Claim]:
+        """
+        Combine claims extracted from consecutive chunks of one text
+        
+        Args:
+            chunk_results: Claims from each chunk, in text order
+            
+        Returns:
+            Deduplicated claims sorted by priority and confidence
+        """
+        all_claims = []
+        for i, chunk_claims in enumerate(chunk_results):
+            # Adjust sentence indices to account for previous chunks
+            for claim in chunk_claims:
+                claim.sentence_index += i * 100  # Offset by chunk number
+            all_claims.extend(chunk_claims)
+        
+        # Deduplicate and merge similar claims
+        with TimedCheckpoint("claim_deduplication", {"total_claims": len(all_claims)}) as cp:
+            final_claims = self._deduplicate_claims(all_claims)
+        
+        # Sort by priority and confidence
+        final_claims.sort(key=lambda x: (x.priority, -x.confidence))
+        return final_claims
+    
     def _extract_claims_from_chunk(self, text: str) -> List[Claim]:
         """
         Extract claims from a single chunk of text
@@ -37,6 +37,7 @@ class FactCheckConfig(BaseSettings):
     # Document Processing
     ocr_language: str = Field(default="eng", env="OCR_LANGUAGE")
     max_document_size_mb: int = Field(default=50, env="MAX_DOCUMENT_SIZE_MB")
+    document_timeout_seconds: float = Field(default=300.0, env="DOCUMENT_TIMEOUT_SECONDS")
     supported_formats: List[str] = Field(default=[
         # Images
         "jpg", "jpeg", "png", "tiff", "bmp", "gif", "webp",
@@ -58,6 +59,21 @@ class FactCheckConfig(BaseSettings):
         "mp3", "wav", "mp4", "avi", "mov"
     ])
     
+    # Content Extraction
+    fc_extract_concurrency: int = Field(
+        default_factory=lambda: min(32, 4 * (os.cpu_count() or 1)),
+        env="FC_EXTRACT_CONCURRENCY"
+    )
+    # Comma-separated DNS servers for content fetches; empty uses the system resolver
+    dns_nameservers: str = Field(default="", env="FC_DNS_NAMESERVERS")
+    
+    # Caching (search results and extracted content persist across runs; empty disables)
+    cache_dir: str = Field(default="~/.cache/fact_checker", env="FC_CACHE_DIR")
+    
+    # Session Management
+    max_sessions: int = Field(default=10000, env="MAX_SESSIONS")
+    session_ttl_seconds: float = Field(default=86400.0, env="SESSION_TTL_SECONDS")
+    
     # Scoring Configuration
     min_authenticity_score: float = Field(default=0.0, env="MIN_AUTHENTICITY_SCORE")
     max_authenticity_score: float = Field(default=1.0, env="MAX_AUTHENTICITY_SCORE")
@@ -15,6 +15,8 @@ import random
 from bs4 import BeautifulSoup
 from newspaper import Article
 
+from .enhanced_content_extractor import enhanced_extractor
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -136,23 +138,24 @@ class CustomScrapingEngine:
         if custom_headers:
             headers.update(custom_headers)
         
+        # Reuse the extractor's pooled keep-alive session
+        session = await enhanced_extractor.get_session()
         timeout = aiohttp.ClientTimeout(total=self.timeout)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            try:
-                async with session.get(url, headers=headers, ssl=True) as response:
-                    if response.status != 200:
-                        raise Exception(f"HTTP {response.status}")
-                    
-                    html = await response.text()
-            except aiohttp.ClientSSLError:
-                # Fallback: Try without SSL verification as last resort
-                logger.warning(f"SSL verification failed for {url}, attempting without verification")
-                async with session.get(url, headers=headers, ssl=False) as response:
-                    if response.status != 200:
-                        raise Exception(f"HTTP {response.status}")
-                    
-                    html = await response.text()
+        
+        async def _get(ssl: bool) -> Tuple[str, str]:
+            async with session.get(url, headers=headers, ssl=ssl, timeout=timeout) as response:
+                if response.status != 200:
+                    raise Exception(f"HTTP {response.status}")
+                
+                html = await response.text()
                 return html, response.headers.get('content-type', '')
+        
+        try:
+            return await _get(True)
+        except aiohttp.ClientSSLError:
+            # Fallback: Try without SSL verification as last resort
+            logger.warning(f"SSL verification failed for {url}, attempting without verification")
+            return await _get(False)
     
     def _extract_with_selectors(self, soup: BeautifulSoup, selectors: List[str]) -> Tuple[str, str]:
         """Extract content and title using CSS selectors"""
@@ -6,14 +6,27 @@ Supports 25+ document formats including Office, OpenOffice, images, archives, an
 import io
 import logging
 import mimetypes
+import mmap
+import multiprocessing
 import os
 import tempfile
+import threading
 import zipfile
 import gc
 import signal
 import resource
+import shutil
+import subprocess
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import ebooklib
 import eml_parser
@@ -55,24 +68,86 @@ except ImportError:
 
 # Audio/Video processing (optional)
 try:
-    import moviepy.editor as mp
     import speech_recognition as sr
     from pydub import AudioSegment
+    from pydub.silence import split_on_silence
 
     AUDIO_VIDEO_SUPPORT = True
 except ImportError:
     AUDIO_VIDEO_SUPPORT = False
 
+# Local speech recognition (optional)
+try:
+    import numpy as np
+    from faster_whisper import WhisperModel
+
+    WHISPER_SUPPORT = True
+except ImportError:
+    WHISPER_SUPPORT = False
+
 from .config import config
 
 logger = logging.getLogger(__name__)
 
+# PCM format fed to speech recognition (16kHz, 16-bit mono)
+AUDIO_SAMPLE_RATE = 16000
+AUDIO_SAMPLE_WIDTH = 2
+
+# Files at least this large are memory-mapped instead of read() for parsing
+MMAP_MIN_BYTES = 1024 * 1024
+
+# Long recordings are split on silence and transcribed concurrently
+AUDIO_CHUNK_MIN_MS = 30_000
+AUDIO_MAX_CONCURRENCY = 6  # Stay under Google Speech rate limits
+
+# Archive members queued per pool worker; bounds the member bytes held in memory
+ARCHIVE_MEMBERS_PER_WORKER = 2
+
+# INT8-quantized Whisper model, loaded once on first use
+_whisper_model: Optional["WhisperModel"] = None
+_whisper_model_lock = threading.Lock()
+
+
+def _get_whisper_model() -> "WhisperModel":
+    """Get the shared faster-whisper model, loading it on first use"""
+    global _whisper_model
+    if _whisper_model is None:
+        # Documents run in parallel threads; only one of them loads the model
+        with _whisper_model_lock:
+            if _whisper_model is None:
+                _whisper_model = WhisperModel(
+                    "small.en",
+                    device="cpu",
+                    compute_type="int8",
+                    cpu_threads=os.cpu_count() or 0,
+                )
+    return _whisper_model
+
+
+# Per-process processor used by archive pool workers
+_worker_processor: Optional["DocumentProcessor"] = None
+
+
+def _process_document_worker(data: bytes, filename: str) -> Dict[str, Any]:
+    """Process a single archived file inside an archive pool worker"""
+    global _worker_processor
+    if _worker_processor is None:
+        # Nested archives run inline rather than starting a pool per worker
+        _worker_processor = DocumentProcessor(parallel_archives=False)
+    return _worker_processor.process_document_bytes(data, filename)
+
 
 class DocumentProcessor:
     """Handles OCR and text extraction from various document formats"""
 
-    def __init__(self):
-        """Initialize document processor with Google Cloud Vision client"""
+    def __init__(self, parallel_archives: bool = True):
+        """
+        Initialize document processor with Google Cloud Vision client
+
+        Args:
+            parallel_archives: Process archive members in a worker pool; when
+                False (inside a pool worker) they are processed inline
+        """
         try:
             self.vision_client = vision.ImageAnnotatorClient()
         except Exception as e:
@@ -81,12 +156,43 @@ class DocumentProcessor:
 
         self.supported_formats = config.supported_formats
 
-    def process_document(self, file_path: Union[str, Path]) -> Dict[str, Any]:
+        # Worker pool for archive members (created on first archive)
+        self.parallel_archives = parallel_archives
+        self._archive_workers = os.cpu_count() or 1
+        self._archive_pool: Optional[ProcessPoolExecutor] = None
+
+    def _get_archive_pool(self) -> ProcessPoolExecutor:
+        """Get the process pool used to process archive members in parallel"""
+        if self._archive_pool is None:
+            # Forking would copy the gRPC Vision client and running threads
+            mp_context = (
+                multiprocessing.get_context("forkserver")
+                if "forkserver" in multiprocessing.get_all_start_methods()
+                else None
+            )
+            self._archive_pool = ProcessPoolExecutor(
+                max_workers=self._archive_workers, mp_context=mp_context
+            )
+        return self._archive_pool
+
+    def close(self) -> None:
+        """Shut down the archive worker pool, if one was started"""
+        if self._archive_pool is not None:
+            self._archive_pool.shutdown()
+            self._archive_pool = None
+
+    def process_document(
+        self,
+        file_path: Union[str, Path],
+        on_text: Optional[Callable[[str], None]] = None,
+    ) -> Dict[str, Any]:
         """
         Process a document and extract text with metadata
 
         Args:
             file_path: Path to the document file
+            on_text: Optional callback receiving extracted text as it becomes
+                available; the pieces concatenate to the final text
 
         Returns:
             Dict containing extracted text, metadata, and processing info
@@ -111,45 +217,112 @@ class DocumentProcessor:
         logger.info(f"Processing document: {file_path.name} ({file_extension})")
 
         try:
-            # Route to appropriate processor based on file extension
+            # PDFs report text page by page; other formats report it once at the end
             if file_extension == "pdf":
                 print("Processing pdf:", file_path)
-                return self._process_pdf_safe(file_path)
-            elif file_extension in ["docx", "doc"]:
-                return self._process_word_document(file_path)
+                return self._process_pdf_safe(file_path, on_text)
+
+            result = self._process_by_format(file_path, file_extension)
+            if on_text is not None and result.get("text"):
+                on_text(result["text"])
+            return result
+
+        except Exception as e:
+            logger.error(f"Error processing document {file_path}: {str(e)}")
+            raise
+
+    def _process_by_format(self, file_path: Path, file_extension: str) -> Dict[str, Any]:
+        """Route a non-PDF document to the processor for its file extension"""
+        # Route to appropriate processor based on file extension
+        if file_extension in ["docx", "doc"]:
+            return self._process_word_document(file_path)
+        elif file_extension in ["pptx", "ppt"]:
+            return self._process_powerpoint(file_path)
+        elif file_extension in ["xlsx", "xls"]:
+            return self._process_excel(file_path)
+        elif file_extension in ["odt", "ods", "odp", "odg"]:
+            return self._process_openoffice(file_path)
+        elif file_extension in ["txt", "md"]:
+            return self._process_text_file(file_path)
+        elif file_extension == "rtf":
+            return self._process_rtf(file_path)
+        elif file_extension in ["html", "htm"]:
+            return self._process_html(file_path)
+        elif file_extension == "xml":
+            return self._process_xml(file_path)
+        elif file_extension in ["epub", "mobi"]:
+            return self._process_ebook(file_path)
+        elif file_extension in ["msg", "eml"]:
+            return self._process_email(file_path)
+        elif file_extension in ["zip", "7z", "rar"]:
+            return self._process_archive(file_path)
+        elif file_extension in ["jpg", "jpeg", "png", "tiff", "bmp", "gif", "webp"]:
+            return self._process_image(file_path)
+        elif file_extension in ["mp3", "wav", "mp4", "avi", "mov"]:
+            return self._process_audio_video(file_path)
+        else:
+            # Fallback: try to determine by content
+            return self._process_unknown_format(file_path)
+
+    def process_document_bytes(self, data: bytes, filename: str) -> Dict[str, Any]:
+        """
+        Process an in-memory document (e.g. an archive member) and extract text
+
+        Args:
+            data: Raw document bytes
+            filename: Original file name, used to route by extension
+
+        Returns:
+            Dict containing extracted text, metadata, and processing info
+        """
+        file_path = Path(filename)
+
+        # Check payload size
+        file_size_mb = len(data) / (1024 * 1024)
+        if file_size_mb > config.max_document_size_mb:
+            raise ValueError(
+                f"File size ({file_size_mb:.1f}MB) exceeds limit ({config.max_document_size_mb}MB)"
+            )
+
+        file_extension = file_path.suffix.lower().lstrip(".")
+
+        if file_extension not in self.supported_formats:
+            raise ValueError(f"Unsupported format: {file_extension}")
+
+        logger.info(f"Processing in-memory document: {file_path.name} ({file_extension})")
+
+        try:
+            # Formats whose parsers accept in-memory streams
+            if file_extension in ["docx", "doc"]:
+                return self._process_word_document(file_path, data)
             elif file_extension in ["pptx", "ppt"]:
-                return self._process_powerpoint(file_path)
+                return self._process_powerpoint(file_path, data)
             elif file_extension in ["xlsx", "xls"]:
-                return self._process_excel(file_path)
-            elif file_extension in ["odt", "ods", "odp", "odg"]:
-                return self._process_openoffice(file_path)
+                return self._process_excel(file_path, data)
             elif file_extension in ["txt", "md"]:
-                return self._process_text_file(file_path)
+                return self._process_text_file(file_path, data)
             elif file_extension == "rtf":
-                return self._process_rtf(file_path)
+                return self._process_rtf(file_path, data)
             elif file_extension in ["html", "htm"]:
-                return self._process_html(file_path)
+                return self._process_html(file_path, data)
             elif file_extension == "xml":
-                return self._process_xml(file_path)
-            elif file_extension in ["epub", "mobi"]:
-                return self._process_ebook(file_path)
-            elif file_extension in ["msg", "eml"]:
-                return self._process_email(file_path)
-            elif file_extension in ["zip", "7z", "rar"]:
-                return self._process_archive(file_path)
+                return self._process_xml(file_path, data)
             elif file_extension in ["jpg", "jpeg", "png", "tiff", "bmp", "gif", "webp"]:
-                return self._process_image(file_path)
-            elif file_extension in ["mp3", "wav", "mp4", "avi", "mov"]:
-                return self._process_audio_video(file_path)
-            else:
-                # Fallback: try to determine by content
-                return self._process_unknown_format(file_path)
+                return self._process_image(file_path, data)
+
+            # Remaining formats need a real file on disk
+            with tempfile.TemporaryDirectory() as temp_dir:
+                temp_file = Path(temp_dir) / file_path.name
+                temp_file.write_bytes(data)
+                return self.process_document(temp_file)
 
         except Exception as e:
-            logger.error(f"Error processing document {file_path}: {str(e)}")
+            logger.error(f"Error processing document {file_path.name}: {str(e)}")
             raise
 
-    def _process_pdf_safe(self, file_path: Path) -> Dict[str, Any]:
+    def _process_pdf_safe(
+        self, file_path: Path, on_text: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, Any]:
         """Memory-safe PDF processing wrapper with timeout and resource monitoring"""
         import time
         import multiprocessing
@@ -179,7 +352,7 @@ class DocumentProcessor:
         timeout_seconds = 300  # 5 minute timeout
         
         try:
-            result = self._process_pdf(file_path)
+            result = self._process_pdf(file_path, on_text)
             
             processing_time = time.time() - start_time
             logger.info(f"PDF processing completed in {processing_time:.2f}s")
@@ -209,7 +382,9 @@ class DocumentProcessor:
                 "word_count": 0,
             }
 
-    def _process_pdf(self, file_path: Path) -> Dict[str, Any]:
+    def _process_pdf(
+        self, file_path: Path, on_text: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, Any]:
         """Process PDF document with improved memory management"""
         text_content = []
         metadata = {
@@ -232,20 +407,42 @@ class DocumentProcessor:
         except Exception as e:
             logger.warning(f"Direct PDF text extraction failed: {str(e)}")
 
+        # Direct text is streamed only once it is known to be part of final_text:
+        # short direct text is emitted just ahead of the OCR pages appended after it
+        pending = [content["text"] for content in text_content]
+
         # If direct extraction failed or yielded little text, use safer OCR
         if not text_content or len(text_content[0]["text"]) < 100:
+            # A page is final once OCR emits it, so pages already streamed stay
+            # in final_text even if OCR fails on a later page
+            ocr_pages: List[str] = []
+
+            def add_page(segment: str) -> None:
+                ocr_pages.append(segment)
+                if on_text is not None:
+                    while pending:
+                        on_text(pending.pop(0))
+                    on_text(segment)
+
             try:
-                ocr_text = self._extract_pdf_text_ocr_safe(file_path, metadata)
-                if ocr_text and ocr_text.strip():
-                    text_content.append({
-                        "method": "safe_ocr",
-                        "text": ocr_text,
-                        "confidence": 0.75
-                    })
-                    logger.info(f"Successfully extracted text via OCR: {len(ocr_text)} characters")
+                self._extract_pdf_text_ocr_safe(file_path, metadata, add_page)
             except Exception as e:
                 logger.error(f"PDF OCR processing failed: {str(e)}")
 
+            ocr_text = "".join(ocr_pages)
+            if ocr_text.strip():
+                text_content.append({
+                    "method": "safe_ocr",
+                    "text": ocr_text,
+                    "confidence": 0.75
+                })
+                logger.info(f"Successfully extracted text via OCR: {len(ocr_text)} characters")
+
+        # Flush direct text not already emitted ahead of OCR pages
+        if on_text is not None:
+            for segment in pending:
+                on_text(segment)
+
         # Combine results
         final_text = ""
         processing_methods = []
@@ -263,51 +460,72 @@ class DocumentProcessor:
             "word_count": len(final_text.split()) if final_text else 0,
         }
 
+    @contextmanager
+    def _open_mapped(self, file_path: Path):
+        """Yield a read-only mmap for large files (zero-copy input), else the path"""
+        if file_path.stat().st_size < MMAP_MIN_BYTES:
+            yield file_path
+            return
+
+        with open(file_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
+
+    @staticmethod
+    def _rewind(source: Union[Path, mmap.mmap]) -> None:
+        """Reset a shared mmap source before handing it to the next reader"""
+        if isinstance(source, mmap.mmap):
+            source.seek(0)
+
     def _extract_pdf_text_direct(self, file_path: Path, metadata: Dict[str, Any]) -> str:
         """Extract text directly from PDF using multiple libraries with error handling"""
         text_results = []
         
-        # Method 1: Try pdfplumber (most reliable for structured text)
-        try:
-            import pdfplumber
-            with pdfplumber.open(file_path) as pdf:
-                metadata["pages"] = len(pdf.pages)
-                text_parts = []
+        # Large files are memory-mapped once and shared by every library below
+        with self._open_mapped(file_path) as source:
+            # Method 1: Try pdfplumber (most reliable for structured text)
+            try:
+                import pdfplumber
+                self._rewind(source)
+                with pdfplumber.open(source) as pdf:
+                    metadata["pages"] = len(pdf.pages)
+                    text_parts = []
                 
-                for page_num, page in enumerate(pdf.pages):
-                    try:
-                        page_text = page.extract_text()
-                        if page_text and page_text.strip():
-                            text_parts.append(f"\n--- Page {page_num + 1} ---\n{page_text}")
-                    except Exception as e:
-                        logger.debug(f"Failed to extract text from page {page_num + 1}: {str(e)}")
-                        continue
+                    for page_num, page in enumerate(pdf.pages):
+                        try:
+                            page_text = page.extract_text()
+                            if page_text and page_text.strip():
+                                text_parts.append(f"\n--- Page {page_num + 1} ---\n{page_text}")
+                        except Exception as e:
+                            logger.debug(f"Failed to extract text from page {page_num + 1}: {str(e)}")
+                            continue
                 
-                if text_parts:
-                    pdfplumber_text = "\n".join(text_parts)
-                    text_results.append(("pdfplumber", pdfplumber_text))
-                    logger.debug(f"pdfplumber extracted {len(pdfplumber_text)} characters")
+                    if text_parts:
+                        pdfplumber_text = "\n".join(text_parts)
+                        text_results.append(("pdfplumber", pdfplumber_text))
+                        logger.debug(f"pdfplumber extracted {len(pdfplumber_text)} characters")
                     
-        except Exception as e:
-            logger.debug(f"pdfplumber extraction failed: {str(e)}")
+            except Exception as e:
+                logger.debug(f"pdfplumber extraction failed: {str(e)}")
         
-        # Method 2: Try pdfminer (good for complex layouts)
-        try:
-            import pdfminer.high_level
-            pdfminer_text = pdfminer.high_level.extract_text(str(file_path))
-            if pdfminer_text and pdfminer_text.strip():
-                text_results.append(("pdfminer", pdfminer_text))
-                logger.debug(f"pdfminer extracted {len(pdfminer_text)} characters")
-        except Exception as e:
-            logger.debug(f"pdfminer extraction failed: {str(e)}")
+            # Method 2: Try pdfminer (good for complex layouts)
+            try:
+                import pdfminer.high_level
+                self._rewind(source)
+                pdfminer_text = pdfminer.high_level.extract_text(source)
+                if pdfminer_text and pdfminer_text.strip():
+                    text_results.append(("pdfminer", pdfminer_text))
+                    logger.debug(f"pdfminer extracted {len(pdfminer_text)} characters")
+            except Exception as e:
+                logger.debug(f"pdfminer extraction failed: {str(e)}")
         
-        # Method 3: Try PyPDF2 as last resort
-        try:
-            with open(file_path, "rb") as file:
-                pdf_reader = PyPDF2.PdfReader(file)
+            # Method 3: Try PyPDF2 as last resort
+            try:
+                self._rewind(source)
+                pdf_reader = PyPDF2.PdfReader(source)
                 if not metadata.get("pages"):
                     metadata["pages"] = len(pdf_reader.pages)
-                
+            
                 pypdf2_text = ""
                 for page_num, page in enumerate(pdf_reader.pages):
                     try:
@@ -317,13 +535,13 @@ class DocumentProcessor:
                     except Exception as e:
                         logger.debug(f"PyPDF2 failed on page {page_num + 1}: {str(e)}")
                         continue
-                
+            
                 if pypdf2_text.strip():
                     text_results.append(("PyPDF2", pypdf2_text))
                     logger.debug(f"PyPDF2 extracted {len(pypdf2_text)} characters")
                     
-        except Exception as e:
-            logger.debug(f"PyPDF2 extraction failed: {str(e)}")
+            except Exception as e:
+                logger.debug(f"PyPDF2 extraction failed: {str(e)}")
         
         # Return the best result (longest text)
         if text_results:
@@ -333,7 +551,12 @@ class DocumentProcessor:
         
         return ""
     
-    def _extract_pdf_text_ocr_safe(self, file_path: Path, metadata: Dict[str, Any]) -> str:
+    def _extract_pdf_text_ocr_safe(
+        self,
+        file_path: Path,
+        metadata: Dict[str, Any],
+        on_text: Optional[Callable[[str], None]] = None,
+    ) -> str:
         """Extract text from PDF using OCR with safer memory management"""
         import gc
         import tempfile
@@ -377,7 +600,10 @@ class DocumentProcessor:
                             
                             page_text = self._perform_ocr_safe(image)
                             if page_text and page_text.strip():
-                                ocr_text += f"\n--- Page {actual_page_num} ---\n{page_text}"
+                                page_segment = f"\n--- Page {actual_page_num} ---\n{page_text}"
+                                ocr_text += page_segment
+                                if on_text is not None:
+                                    on_text(page_segment)
                             
                             # Explicitly close the image to free memory
                             image.close()
@@ -431,14 +657,16 @@ class DocumentProcessor:
             logger.warning(f"Tesseract OCR failed: {str(e)}")
             return ""
 
-    def _process_word_document(self, file_path: Path) -> Dict[str, Any]:
+    def _process_word_document(
+        self, file_path: Path, data: Optional[bytes] = None
+    ) -> Dict[str, Any]:
         """Process DOCX/DOC document"""
         file_extension = file_path.suffix.lower().lstrip(".")
 
         try:
             if file_extension == "docx":
                 # Native DOCX processing
-                doc = Document(file_path)
+                doc = Document(io.BytesIO(data) if data is not None else file_path)
 
                 # Extract text from paragraphs
                 paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
@@ -464,9 +692,12 @@ class DocumentProcessor:
 
             elif file_extension == "doc":
                 # Legacy DOC processing using mammoth
-                with open(file_path, "rb") as docx_file:
-                    result = mammoth.extract_text(docx_file)
-                    text = result.value
+                if data is not None:
+                    result = mammoth.extract_text(io.BytesIO(data))
+                else:
+                    with open(file_path, "rb") as docx_file:
+                        result = mammoth.extract_text(docx_file)
+                text = result.value
 
                 metadata = {
                     "file_type": file_extension,
@@ -486,10 +717,18 @@ class DocumentProcessor:
             logger.error(f"Word document processing failed: {str(e)}")
             raise
 
-    def _process_image(self, file_path: Path) -> Dict[str, Any]:
+    def _process_image(
+        self, file_path: Path, data: Optional[bytes] = None
+    ) -> Dict[str, Any]:
         """Process image document using OCR"""
         try:
-            with Image.open(file_path) as image:
+            with ExitStack() as stack:
+                if data is not None:
+                    source = io.BytesIO(data)
+                else:
+                    source = stack.enter_context(self._open_mapped(file_path))
+                image = stack.enter_context(Image.open(source))
+
                 # Perform OCR using Google Cloud Vision API first
                 text = self._perform_google_vision_ocr(image)
                 confidence = 0.85
@@ -594,10 +833,12 @@ class DocumentProcessor:
 
         return metadata
 
-    def _process_powerpoint(self, file_path: Path) -> Dict[str, Any]:
+    def _process_powerpoint(
+        self, file_path: Path, data: Optional[bytes] = None
+    ) -> Dict[str, Any]:
         """Process PowerPoint presentations (PPTX/PPT)"""
         try:
-            prs = Presentation(file_path)
+            prs = Presentation(io.BytesIO(data) if data is not None else file_path)
 
             slides_text = []
             slide_count = 0
@@ -636,7 +877,9 @@ class DocumentProcessor:
             logger.error(f"PowerPoint processing failed: {str(e)}")
             raise
 
-    def _process_excel(self, file_path: Path) -> Dict[str, Any]:
+    def _process_excel(
+        self, file_path: Path, data: Optional[bytes] = None
+    ) -> Dict[str, Any]:
         """Process Excel spreadsheets (XLSX/XLS)"""
         file_extension = file_path.suffix.lower().lstrip(".")
 
@@ -645,7 +888,9 @@ class DocumentProcessor:
 
             if file_extension == "xlsx":
                 # Use openpyxl for XLSX
-                workbook = load_workbook(file_path, data_only=True)
+                workbook = load_workbook(
+                    io.BytesIO(data) if data is not None else file_path, data_only=True
+                )
 
                 for sheet_name in workbook.sheetnames:
                     sheet = workbook[sheet_name]
@@ -663,17 +908,18 @@ class DocumentProcessor:
 
             elif file_extension == "xls":
                 # Use xlrd for XLS
-                workbook = xlrd.open_workbook(file_path)
+                if data is not None:
+                    workbook = xlrd.open_workbook(file_contents=data)
+                else:
+                    workbook = xlrd.open_workbook(file_path)
 
                 for sheet_idx in range(workbook.nsheets):
                     sheet = workbook.sheet_by_index(sheet_idx)
                     sheet_content = [f"\n--- Sheet: {sheet.name} ---"]
 
                     for row_idx in range(sheet.nrows):
-                        row_data = [
-                            str(sheet.cell_value(row_idx, col_idx))
-                            for col_idx in range(sheet.ncols)
-                        ]
+                        # row_values fetches the whole row in one call
+                        row_data = [str(value) for value in sheet.row_values(row_idx)]
                         if any(cell.strip() for cell in row_data if cell):
                             sheet_content.append(" | ".join(row_data))
 
@@ -740,11 +986,19 @@ class DocumentProcessor:
             logger.error(f"OpenOffice document processing failed: {str(e)}")
             raise
 
-    def _process_text_file(self, file_path: Path) -> Dict[str, Any]:
+    def _read_text(self, file_path: Path, data: Optional[bytes] = None) -> str:
+        """Read UTF-8 text from in-memory bytes or from disk"""
+        if data is not None:
+            return data.decode("utf-8", errors="ignore")
+        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
+            return f.read()
+
+    def _process_text_file(
+        self, file_path: Path, data: Optional[bytes] = None
+    ) -> Dict[str, Any]:
         """Process plain text and markdown files"""
         try:
-            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                text = f.read()
+            text = self._read_text(file_path, data)
 
             file_extension = file_path.suffix.lower().lstrip(".")
 
@@ -770,11 +1024,12 @@ class DocumentProcessor:
             logger.error(f"Text file processing failed: {str(e)}")
             raise
 
-    def _process_rtf(self, file_path: Path) -> Dict[str, Any]:
+    def _process_rtf(
+        self, file_path: Path, data: Optional[bytes] = None
+    ) -> Dict[str, Any]:
         """Process RTF documents"""
         try:
-            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                rtf_content = f.read()
+            rtf_content = self._read_text(file_path, data)
 
             # Extract plain text from RTF
             text = striprtf.rtf_to_text(rtf_content)
@@ -796,11 +1051,12 @@ class DocumentProcessor:
             logger.error(f"RTF processing failed: {str(e)}")
             raise
 
-    def _process_html(self, file_path: Path) -> Dict[str, Any]:
+    def _process_html(
+        self, file_path: Path, data: Optional[bytes] = None
+    ) -> Dict[str, Any]:
         """Process HTML documents"""
         try:
-            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                html_content = f.read()
+            html_content = self._read_text(file_path, data)
 
             # Parse HTML and extract text
             soup = BeautifulSoup(html_content, "html.parser")
@@ -835,11 +1091,12 @@ class DocumentProcessor:
             logger.error(f"HTML processing failed: {str(e)}")
             raise
 
-    def _process_xml(self, file_path: Path) -> Dict[str, Any]:
+    def _process_xml(
+        self, file_path: Path, data: Optional[bytes] = None
+    ) -> Dict[str, Any]:
         """Process XML documents"""
         try:
-            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                xml_content = f.read()
+            xml_content = self._read_text(file_path, data)
 
             # Parse XML and extract text content
             soup = BeautifulSoup(xml_content, "xml")
@@ -996,6 +1253,46 @@ class DocumentProcessor:
             logger.error(f"Email processing failed: {str(e)}")
             raise
 
+    def _iter_archive_members(self, file_path: Path, file_extension: str):
+        """Yield (name, bytes) for supported archive members without extracting to disk"""
+
+        def is_wanted(member_name: str, size: int) -> bool:
+            member_ext = Path(member_name).suffix.lower().lstrip(".")
+            # Skip unsupported files and nested archives of the same type
+            if member_ext not in self.supported_formats or member_ext == file_extension:
+                return False
+            if size / (1024 * 1024) > config.max_document_size_mb:
+                logger.warning(f"Skipping oversized archived file {member_name}")
+                return False
+            return True
+
+        if file_extension == "zip":
+            with zipfile.ZipFile(file_path, "r") as zip_ref:
+                for info in zip_ref.infolist():
+                    if not info.is_dir() and is_wanted(info.filename, info.file_size):
+                        with zip_ref.open(info) as member:
+                            yield info.filename, member.read()
+
+        elif file_extension == "7z" and py7zr:
+            with py7zr.SevenZipFile(file_path, mode="r") as archive:
+                # readall decompresses the solid stream once for all members
+                for member_name, member in archive.readall().items():
+                    data = member.getvalue()
+                    if is_wanted(member_name, len(data)):
+                        yield member_name, data
+
+        elif file_extension == "rar" and rarfile:
+            with rarfile.RarFile(file_path) as rar_ref:
+                for info in rar_ref.infolist():
+                    if not info.isdir() and is_wanted(info.filename, info.file_size):
+                        with rar_ref.open(info) as member:
+                            yield info.filename, member.read()
+
+        else:
+            raise ValueError(
+                f"Archive format {file_extension} not supported or library not available"
+            )
+
     def _process_archive(self, file_path: Path) -> Dict[str, Any]:
         """Process archive files (ZIP/7Z/RAR)"""
         file_extension = file_path.suffix.lower().lstrip(".")
@@ -1004,47 +1301,51 @@ class DocumentProcessor:
             extracted_texts = []
             processed_files = []
 
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-
-                # Extract archive
-                if file_extension == "zip":
-                    with zipfile.ZipFile(file_path, "r") as zip_ref:
-                        zip_ref.extractall(temp_path)
-
-                elif file_extension == "7z" and py7zr:
-                    with py7zr.SevenZipFile(file_path, mode="r") as archive:
-                        archive.extractall(temp_path)
-
-                elif file_extension == "rar" and rarfile:
-                    with rarfile.RarFile(file_path) as rar_ref:
-                        rar_ref.extractall(temp_path)
+            results = {}
 
-                else:
-                    raise ValueError(
-                        f"Archive format {file_extension} not supported or library not available"
+            def collect(member_name: str, get_result: Callable[[], Dict[str, Any]]):
+                try:
+                    result = get_result()
+                    if result["success"]:
+                        results[member_name] = result["text"]
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to process archived file {member_name}: {str(e)}"
                     )
 
-                # Process extracted files
-                for extracted_file in temp_path.rglob("*"):
-                    if extracted_file.is_file():
-                        try:
-                            file_ext = extracted_file.suffix.lower().lstrip(".")
-                            if (
-                                file_ext in self.supported_formats
-                                and file_ext != file_extension
-                            ):
-                                # Recursively process supported files
-                                result = self.process_document(extracted_file)
-                                if result["success"]:
-                                    extracted_texts.append(
-                                        f"\n--- File: {extracted_file.name} ---\n{result['text']}"
-                                    )
-                                    processed_files.append(extracted_file.name)
-                        except Exception as e:
-                            logger.warning(
-                                f"Failed to process archived file {extracted_file.name}: {str(e)}"
-                            )
+            members = self._iter_archive_members(file_path, file_extension)
+            if not self.parallel_archives:
+                for member_name, data in members:
+                    collect(
+                        member_name,
+                        lambda: self.process_document_bytes(data, member_name),
+                    )
+            else:
+                # Stream supported members straight from the archive into the pool,
+                # processing them in parallel (PDF/OCR work is CPU-bound); only a
+                # few members per worker are in flight at once
+                pool = self._get_archive_pool()
+                max_in_flight = ARCHIVE_MEMBERS_PER_WORKER * self._archive_workers
+                futures = {}
+                for member_name, data in members:
+                    if len(futures) >= max_in_flight:
+                        done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            collect(futures.pop(future), future.result)
+                    future = pool.submit(_process_document_worker, data, member_name)
+                    futures[future] = member_name
+
+                for future in as_completed(futures):
+                    collect(futures[future], future.result)
+
+            # Emit sections in a stable order regardless of completion order; keyed
+            # by full member path so same-named files in different folders all appear
+            for member_name in sorted(results):
+                file_name = Path(member_name).name
+                extracted_texts.append(
+                    f"\n--- File: {file_name} ---\n{results[member_name]}"
+                )
+                processed_files.append(file_name)
 
             text = "\n".join(extracted_texts)
 
@@ -1067,66 +1368,114 @@ class DocumentProcessor:
             logger.error(f"Archive processing failed: {str(e)}")
             raise
 
+    def _decode_audio_pcm(self, file_path: Path) -> bytes:
+        """Decode any audio/video file to raw 16-bit mono PCM via an ffmpeg pipe"""
+        if not shutil.which("ffmpeg"):
+            raise ValueError("Audio/video processing requires ffmpeg on PATH")
+
+        result = subprocess.run(
+            [
+                "ffmpeg",
+                "-loglevel", "error",
+                "-i", str(file_path),
+                "-vn",
+                "-ac", "1",
+                "-ar", str(AUDIO_SAMPLE_RATE),
+                "-f", "s16le",
+                "-",
+            ],
+            capture_output=True,
+            check=True,
+        )
+        return result.stdout
+
+    def _transcribe_segment(self, segment: "AudioSegment") -> Tuple[str, str]:
+        """Transcribe one audio segment, returning (transcript, engine)"""
+        recognizer = sr.Recognizer()
+        audio_data = sr.AudioData(
+            segment.raw_data, segment.frame_rate, segment.sample_width
+        )
+
+        # Try Google Speech Recognition first, fallback to others
+        try:
+            return recognizer.recognize_google(audio_data), "google"
+        except sr.UnknownValueError:
+            return "", "failed"
+        except sr.RequestError as e:
+            # Fallback to offline recognition
+            try:
+                return recognizer.recognize_sphinx(audio_data), "sphinx"
+            except:
+                return f"Speech recognition service error: {e}", "error"
+
+    def _transcribe_whisper(self, audio: "AudioSegment") -> str:
+        """Transcribe audio locally with faster-whisper, returning "" on failure"""
+        if not WHISPER_SUPPORT:
+            return ""
+
+        try:
+            samples = (
+                np.frombuffer(audio.raw_data, dtype=np.int16).astype(np.float32)
+                / 32768.0
+            )
+            segments, _ = _get_whisper_model().transcribe(
+                samples, vad_filter=True, beam_size=1
+            )
+            return " ".join(segment.text.strip() for segment in segments).strip()
+        except Exception as e:
+            logger.warning(f"Whisper transcription failed: {str(e)}")
+            return ""
+
+    def _transcribe_google_chunked(self, audio: "AudioSegment") -> Tuple[str, str]:
+        """Transcribe audio with Google Speech, splitting long audio into chunks"""
+        # Split long audio on silence so chunks can be transcribed in parallel
+        segments = [audio]
+        if len(audio) > AUDIO_CHUNK_MIN_MS:
+            segments = split_on_silence(
+                audio, min_silence_len=500, silence_thresh=-40, keep_silence=200
+            ) or [audio]
+
+        with ThreadPoolExecutor(
+            max_workers=min(AUDIO_MAX_CONCURRENCY, len(segments))
+        ) as pool:
+            chunk_results = list(pool.map(self._transcribe_segment, segments))
+
+        # Concatenate transcripts in order
+        transcript = " ".join(text for text, _ in chunk_results if text)
+        methods = [method for _, method in chunk_results if method != "failed"]
+        recognition_method = methods[0] if methods else "failed"
+        if not transcript:
+            transcript = "Could not understand audio"
+
+        return transcript, recognition_method
+
     def _process_audio_video(self, file_path: Path) -> Dict[str, Any]:
         """Process audio and video files using speech recognition"""
         if not AUDIO_VIDEO_SUPPORT:
             raise ValueError(
-                "Audio/video processing requires additional dependencies. Install with: pip install SpeechRecognition pydub moviepy"
+                "Audio/video processing requires additional dependencies. Install with: pip install SpeechRecognition pydub (and ffmpeg)"
             )
 
         file_extension = file_path.suffix.lower().lstrip(".")
 
         try:
-            recognizer = sr.Recognizer()
-
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_audio_path = Path(temp_dir) / "audio.wav"
-
-                # Extract audio from video files
-                if file_extension in ["mp4", "avi", "mov"]:
-                    video = mp.VideoFileClip(str(file_path))
-                    audio = video.audio
-                    audio.write_audiofile(
-                        str(temp_audio_path), verbose=False, logger=None
-                    )
-                    audio.close()
-                    video.close()
-
-                # Convert audio to WAV format for speech recognition
-                elif file_extension in ["mp3"]:
-                    audio = AudioSegment.from_mp3(file_path)
-                    audio.export(temp_audio_path, format="wav")
-
-                elif file_extension == "wav":
-                    temp_audio_path = file_path
-
-                else:
-                    raise ValueError(
-                        f"Unsupported audio/video format: {file_extension}"
-                    )
-
-                # Perform speech recognition
-                with sr.AudioFile(str(temp_audio_path)) as source:
-                    audio_data = recognizer.record(source)
-
-                # Try Google Speech Recognition first, fallback to others
-                transcript = ""
-                recognition_method = ""
+            if file_extension not in ["mp3", "wav", "mp4", "avi", "mov"]:
+                raise ValueError(f"Unsupported audio/video format: {file_extension}")
+
+            # Decode straight to 16kHz mono PCM in a single ffmpeg pass
+            audio = AudioSegment(
+                data=self._decode_audio_pcm(file_path),
+                sample_width=AUDIO_SAMPLE_WIDTH,
+                frame_rate=AUDIO_SAMPLE_RATE,
+                channels=1,
+            )
 
-                try:
-                    transcript = recognizer.recognize_google(audio_data)
-                    recognition_method = "google"
-                except sr.UnknownValueError:
-                    transcript = "Could not understand audio"
-                    recognition_method = "failed"
-                except sr.RequestError as e:
-                    # Fallback to offline recognition
-                    try:
-                        transcript = recognizer.recognize_sphinx(audio_data)
-                        recognition_method = "sphinx"
-                    except:
-                        transcript = f"Speech recognition service error: {e}"
-                        recognition_method = "error"
+            # Local Whisper first: no network round-trip per request
+            transcript = self._transcribe_whisper(audio)
+            if transcript:
+                recognition_method = "whisper_int8"
+            else:
+                transcript, recognition_method = self._transcribe_google_chunked(audio)
 
             metadata = {
                 "file_type": file_extension,
@@ -4,26 +4,40 @@ Main agent implementation using Google Agent Development Kit
 """
 
 import asyncio
+import bisect
 import json
 import logging
-from dataclasses import asdict
+import threading
+import time
+from contextlib import asynccontextmanager
+from collections import Counter, deque
+from dataclasses import asdict, replace
+from functools import cached_property, partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 import google.generativeai as genai
+import numpy as np
 
 # Google AI imports
 import vertexai
 from vertexai.generative_models import GenerativeModel
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .authenticity_scorer import AuthenticityScorer
-from .claim_extractor import ClaimExtractor
+from .claim_extractor import MAX_CHUNK_SIZE, Claim, ClaimExtractor
 
 # Local imports
 from .config import config
 from .document_processor import DocumentProcessor
-from .fact_checker import FactChecker
-from .performance_monitor import PerformanceMonitor, monitor_performance, with_throttling
+from .enhanced_content_extractor import enhanced_extractor
+from .fact_checker import FactChecker, FactCheckResult
+from .performance_cache import HighPerformanceCache
+from .performance_monitor import PerformanceMonitor, monitor_performance
 from .report_generator import ReportGenerator
 from .security_manager import SecurityManager
 
@@ -32,27 +46,51 @@ logging.basicConfig(level=getattr(logging, config.log_level))
 logger = logging.getLogger(__name__)
 
 
-class FactCheckAgent:
-    """Main fact-checking agent using Google AI"""
+# Overall authenticity levels, indexed by bisect_right over the score thresholds
+AUTHENTICITY_THRESHOLDS = [0.2, 0.4, 0.6, 0.8]
+AUTHENTICITY_LEVELS = [
+    ("unreliable", "Document contains unreliable or false information"),
+    (
+        "low_authenticity",
+        "Document contains questionable information - verify before use",
+    ),
+    (
+        "mixed_authenticity",
+        "Document contains mix of verified and unverified claims",
+    ),
+    (
+        "mostly_authentic",
+        "Document is generally reliable with some verification needed",
+    ),
+    ("highly_authentic", "Document contains highly reliable information"),
+]
+
+# Prompt for chat queries; the anonymized user message fills {message}
+CHAT_PROMPT_TEMPLATE = """
+You are a fact-checking AI assistant. Your role is to help users understand fact-checking processes, 
+provide information about document analysis, and explain authenticity scoring.
+
+User question: {message}
+
+Guidelines:
+- Be helpful and informative about fact-checking
+- Explain how the system works when asked
+- Suggest document analysis when appropriate
+- Be concise but thorough
+"""
 
-    def __init__(self):
-        """Initialize the fact-check agent"""
-        # Initialize Vertex AI
+# Shared chat model, created on first use
+_generative_model = None
+
+
+def _get_generative_model() -> GenerativeModel:
+    """Initialize Vertex AI and create the shared chat model on first use"""
+    global _generative_model
+    if _generative_model is None:
         vertexai.init(
             project=config.google_cloud_project, location=config.vertex_ai_location
         )
-
-        # Initialize components
-        self.document_processor = DocumentProcessor()
-        self.claim_extractor = ClaimExtractor()
-        self.fact_checker = FactChecker()
-        self.authenticity_scorer = AuthenticityScorer()
-        self.report_generator = ReportGenerator()
-        self.security_manager = SecurityManager()
-        self.performance_monitor = PerformanceMonitor()
-
-        # Create Google AI model
-        self.model = GenerativeModel(
+        _generative_model = GenerativeModel(
             model_name=config.vertex_ai_model,
             generation_config={
                 "temperature": 0.1,  # Low temperature for consistent, factual responses
@@ -67,18 +105,57 @@ class FactCheckAgent:
                 "HARM_CATEGORY_DANGEROUS_CONTENT": "BLOCK_MEDIUM_AND_ABOVE",
             },
         )
+    return _generative_model
+
+
+class FactCheckAgent:
+    """Main fact-checking agent using Google AI"""
+
+    def __init__(self):
+        """Initialize the fact-check agent"""
+        # Initialize components
+        self.document_processor = DocumentProcessor()
+        self.claim_extractor = ClaimExtractor()
+        self.fact_checker = FactChecker()
+        self.authenticity_scorer = AuthenticityScorer()
+        self.report_generator = ReportGenerator()
+        self.security_manager = SecurityManager()
+        self.performance_monitor = PerformanceMonitor()
+
+        # Session management, bounded in size and lifetime
+        self.sessions = HighPerformanceCache(
+            max_size=config.max_sessions, default_ttl=config.session_ttl_seconds
+        )
 
-        # Session management
-        self.sessions = {}
+        # Fact checks in flight, keyed by normalized claim text and type, so
+        # concurrent documents repeating a claim share one check
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._shared_checks: Set[asyncio.Task] = set()
 
         logger.info("Fact Check Agent initialized successfully")
 
+    @cached_property
+    def model(self) -> GenerativeModel:
+        """Google AI model, initialized on first chat query"""
+        return _get_generative_model()
+
+    async def aclose(self) -> None:
+        """Stop shared fact checks and close the shared HTTP connection and worker pools on agent shutdown"""
+        for task in list(self._shared_checks):
+            task.cancel()
+        await enhanced_extractor.close()
+        # Pool shutdown waits for running workers, so keep it off the event loop
+        await asyncio.get_event_loop().run_in_executor(
+            None, self.document_processor.close
+        )
+
     @monitor_performance("document_analysis")
     async def analyze_document(
         self,
         document_path: Union[str, Path],
         user_id: str = "default_user",
         session_id: str = None,
+        stream_path: Optional[Union[str, Path]] = None,
     ) -> Dict[str, Any]:
         """
         Analyze a document and fact-check its claims
@@ -87,6 +164,8 @@ class FactCheckAgent:
             document_path: Path to the document to analyze
             user_id: User identifier for session management
             session_id: Session identifier for security validation
+            stream_path: Optional NDJSON file to write scored claims to instead
+                of returning them in the report
 
         Returns:
             Comprehensive fact-check report
@@ -108,237 +187,387 @@ class FactCheckAgent:
                 document_path = safe_path
             except Exception as e:
                 return {"success": False, "error": f"Invalid document path: {str(e)}"}
-            # Step 1: OCR and text extraction
-            logger.info("Step 1: Processing document...")
-            document_result = self.document_processor.process_document(document_path)
-
-            if not document_result["success"]:
-                return {
-                    "success": False,
-                    "error": "Failed to process document",
-                    "details": document_result,
-                }
 
-            extracted_text = document_result["text"]
-            logger.info(
-                f"Extracted {document_result['word_count']} words from document"
-            )
+            # Security cleanup: the document is securely deleted however analysis ends
+            async with self._document_guard(document_path) as workers:
+                # Steps 1-2: OCR and text extraction, pipelined with claim extraction
+                logger.info("Step 1: Processing document and extracting claims...")
+                document_result, claims = await self._process_and_extract_claims(
+                    document_path, workers
+                )
 
-            # Step 2: Extract claims
-            logger.info("Step 2: Extracting claims...")
-            claims = self.claim_extractor.extract_claims(extracted_text)
-            logger.info(f"Extracted {len(claims)} claims for fact-checking")
+                if not document_result["success"]:
+                    return {
+                        "success": False,
+                        "error": "Failed to process document",
+                        "details": document_result,
+                    }
 
-            if not claims:
-                return {
-                    "success": True,
-                    "message": "No factual claims found in document",
-                    "document_info": document_result["metadata"],
-                    "claims": [],
-                    "overall_authenticity": "no_claims",
-                }
+                logger.info(
+                    f"Extracted {document_result['word_count']} words from document"
+                )
+                logger.info(f"Extracted {len(claims)} claims for fact-checking")
+
+                if not claims:
+                    return {
+                        "success": True,
+                        "message": "No factual claims found in document",
+                        "document_info": document_result["metadata"],
+                        "claims": [],
+                        "overall_authenticity": "no_claims",
+                    }
 
-            # Step 3: Fact-check claims
-            logger.info("Step 3: Fact-checking claims...")
-            fact_check_results = await self.fact_checker.fact_check_claims(claims)
+                # Step 3: Fact-check claims
+                logger.info("Step 3: Fact-checking claims...")
+                fact_check_results = await self._fact_check_claims_shared(claims)
 
-            # Step 4: Calculate authenticity scores
-            logger.info("Step 4: Calculating authenticity scores...")
-            scored_results = []
-
-            for result in fact_check_results:
-                if result.verification_status != "error":
-                    # Calculate detailed authenticity score
-                    scoring_breakdown = (
-                        self.authenticity_scorer.calculate_authenticity_score(
-                            claim_text=result.claim.text,
-                            claim_type=result.claim.claim_type.value,
-                            sources=result.sources_checked,
-                            evidence=result.evidence,
-                            contradictions=result.contradictions,
-                            claim_entities=[e["text"] for e in result.claim.entities],
-                        )
-                    )
+                # Step 4: Calculate authenticity scores
+                logger.info("Step 4: Calculating authenticity scores...")
 
-                    # Create comprehensive result
-                    scored_result = {
-                        "claim": {
-                            "text": result.claim.text,
-                            "type": result.claim.claim_type.value,
-                            "confidence": result.claim.confidence,
-                            "priority": result.claim.priority,
-                            "entities": result.claim.entities,
-                            "keywords": result.claim.keywords,
-                        },
-                        "verification": {
-                            "status": result.verification_status,
-                            "authenticity_score": scoring_breakdown.final_score,
-                            "authenticity_level": scoring_breakdown.authenticity_level.value,
-                            "confidence_interval": scoring_breakdown.confidence_interval,
-                            "explanation": scoring_breakdown.explanation,
-                        },
-                        "scoring_breakdown": {
-                            "source_credibility": scoring_breakdown.source_credibility_score,
-                            "cross_reference": scoring_breakdown.cross_reference_score,
-                            "evidence_quality": scoring_breakdown.evidence_quality_score,
-                            "publication_date": scoring_breakdown.publication_date_score,
-                            "expert_consensus": scoring_breakdown.expert_consensus_score,
-                        },
+                # Score all successful claims in one batch, off the event loop
+                scoring_items = [
+                    {
+                        "claim_text": result.claim.text,
+                        "claim_type": result.claim.claim_type.value,
                         "sources": result.sources_checked,
                         "evidence": result.evidence,
                         "contradictions": result.contradictions,
-                        "processing_time": result.processing_time,
+                        "claim_entities": result.claim.entity_texts,
                     }
+                    for result in fact_check_results
+                    if result.verification_status != "error"
+                ]
+                loop = asyncio.get_event_loop()
+                scoring_breakdowns = iter(
+                    await loop.run_in_executor(
+                        None,
+                        self.authenticity_scorer.calculate_authenticity_scores_batch,
+                        scoring_items,
+                    )
+                )
+
+                scored_results = self._iter_scored_results(
+                    fact_check_results, scoring_breakdowns
+                )
+
+                # Step 5: Calculate overall document authenticity
+                if stream_path:
+                    # Write scored claims out as they are built, not all at once
+                    status_counts, overall_authenticity = await loop.run_in_executor(
+                        None, self._summarize_to_stream, scored_results, stream_path
+                    )
                 else:
-                    # Handle error cases
-                    scored_result = {
-                        "claim": {
-                            "text": result.claim.text,
-                            "type": result.claim.claim_type.value,
-                            "confidence": result.claim.confidence,
-                            "priority": result.claim.priority,
-                        },
-                        "verification": {
-                            "status": "error",
-                            "error_message": result.error_message,
-                        },
-                    }
+                    scored_results = list(scored_results)
+                    status_counts, overall_authenticity = self._summarize(
+                        scored_results
+                    )
 
-                scored_results.append(scored_result)
-
-            # Step 5: Calculate overall document authenticity
-            overall_authenticity = self._calculate_overall_authenticity(scored_results)
-
-            # Generate final report
-            report = {
-                "success": True,
-                "document_info": document_result["metadata"],
-                "summary": {
-                    "total_claims": len(claims),
-                    "verified_claims": len(
-                        [
-                            r
-                            for r in scored_results
-                            if r["verification"]["status"] == "verified"
-                        ]
-                    ),
-                    "disputed_claims": len(
-                        [
-                            r
-                            for r in scored_results
-                            if r["verification"]["status"] == "disputed"
-                        ]
-                    ),
-                    "unverified_claims": len(
-                        [
-                            r
-                            for r in scored_results
-                            if r["verification"]["status"] == "unverified"
-                        ]
-                    ),
-                    "overall_authenticity_score": overall_authenticity["score"],
-                    "overall_authenticity_level": overall_authenticity["level"],
-                    "recommendation": overall_authenticity["recommendation"],
-                },
-                "claims": scored_results,
-                "processing_metadata": {
-                    "extraction_method": document_result["metadata"].get(
-                        "processing_method"
-                    ),
-                    "total_processing_time": sum(
-                        r.processing_time for r in fact_check_results
+                # Generate final report
+                report = {
+                    "success": True,
+                    "document_info": document_result["metadata"],
+                    "summary": {
+                        "total_claims": len(claims),
+                        "verified_claims": status_counts["verified"],
+                        "disputed_claims": status_counts["disputed"],
+                        "unverified_claims": status_counts["unverified"],
+                        "overall_authenticity_score": overall_authenticity["score"],
+                        "overall_authenticity_level": overall_authenticity["level"],
+                        "recommendation": overall_authenticity["recommendation"],
+                    },
+                    **(
+                        {"claims_path": str(stream_path)}
+                        if stream_path
+                        else {"claims": scored_results}
                     ),
-                    "timestamp": str(asyncio.get_event_loop().time()),
-                },
-            }
-
-            logger.info("Document analysis completed successfully")
+                    "processing_metadata": {
+                        "extraction_method": document_result["metadata"].get(
+                            "processing_method"
+                        ),
+                        "total_processing_time": sum(
+                            r.processing_time for r in fact_check_results
+                        ),
+                        "timestamp": str(time.monotonic()),
+                    },
+                }
 
-            # Security cleanup: Ensure document is securely deleted after processing
-            try:
-                self.security_manager.secure_document_cleanup(document_path)
-            except Exception as cleanup_error:
-                logger.warning(f"Document cleanup warning: {cleanup_error}")
+                logger.info("Document analysis completed successfully")
 
-            return report
+                return report
 
         except Exception as e:
             logger.error(f"Error analyzing document: {str(e)}")
 
-            # Attempt cleanup even on error
+            return {
+                "success": False,
+                "error": str(e),
+                "timestamp": str(time.monotonic()),
+            }
+
+    @asynccontextmanager
+    async def _document_guard(self, document_path: Union[str, Path]):
+        """Securely clean up a document once its analysis and its workers finish"""
+
+        def cleanup(_=None) -> None:
             try:
                 self.security_manager.secure_document_cleanup(document_path)
             except Exception as cleanup_error:
                 logger.warning(f"Document cleanup warning: {cleanup_error}")
 
-            return {
-                "success": False,
-                "error": str(e),
-                "timestamp": str(asyncio.get_event_loop().time()),
-            }
+        # Executor futures working on the document; their threads can't be
+        # cancelled, so they may outlive a cancelled (e.g. timed out) analysis
+        workers: List[asyncio.Future] = []
+        try:
+            yield workers
+        finally:
+            running = [worker for worker in workers if not worker.done()]
+            if running:
+                logger.warning(
+                    f"Deferring document cleanup until its workers finish: {document_path}"
+                )
+                asyncio.gather(*running, return_exceptions=True).add_done_callback(
+                    cleanup
+                )
+            else:
+                cleanup()
 
-    def _calculate_overall_authenticity(
-        self, scored_results: List[Dict]
-    ) -> Dict[str, Any]:
-        """Calculate overall document authenticity"""
-        if not scored_results:
-            return {
+    async def _process_and_extract_claims(
+        self, document_path: Union[str, Path], workers: List[asyncio.Future]
+    ) -> Tuple[Dict[str, Any], List[Claim]]:
+        """Process a document while extracting claims from the text produced so far
+
+        Executor futures are added to ``workers`` and only awaited through
+        shields, so they stay pending until their threads actually return.
+        """
+        loop = asyncio.get_event_loop()
+        segments: asyncio.Queue = asyncio.Queue()
+
+        def on_text(segment: str) -> None:
+            loop.call_soon_threadsafe(segments.put_nowait, segment)
+
+        document_future = loop.run_in_executor(
+            None,
+            partial(self.document_processor.process_document, document_path, on_text),
+        )
+        workers.append(document_future)
+        # Scheduled after every on_text call, so it marks the end of the text
+        document_future.add_done_callback(lambda _: segments.put_nowait(None))
+
+        # Set once the document fails, as its streamed text isn't its final text
+        discarded = threading.Event()
+        claim_futures = []
+
+        def extract_chunk(text: str) -> List[Claim]:
+            # Chunks still queued when the document fails are never extracted
+            if discarded.is_set():
+                return []
+            return self.claim_extractor.extract_claims(text)
+
+        def submit_chunk(text: str) -> None:
+            claim_futures.append(loop.run_in_executor(None, extract_chunk, text))
+            workers.append(claim_futures[-1])
+
+        async def discard_chunks() -> None:
+            discarded.set()
+            # Retrieve chunk extraction failures; the document's is reported
+            await asyncio.gather(
+                *(asyncio.shield(future) for future in claim_futures),
+                return_exceptions=True,
+            )
+
+        # Hand each prompt-sized run of text to the claim extractor while
+        # document processing (e.g. page-by-page OCR) continues
+        buffer: List[str] = []
+        buffered = 0
+        while True:
+            segment = await segments.get()
+            if segment is None:
+                break
+            buffer.append(segment)
+            buffered += len(segment)
+            if buffered >= MAX_CHUNK_SIZE:
+                submit_chunk("".join(buffer))
+                buffer = []
+                buffered = 0
+
+        try:
+            document_result = await asyncio.shield(document_future)
+        except Exception:
+            await discard_chunks()
+            raise
+        if not document_result["success"]:
+            await discard_chunks()
+            return document_result, []
+
+        # The document is done, so the rest of the text forms the last chunk
+        if buffer:
+            submit_chunk("".join(buffer))
+        chunk_results = await asyncio.gather(
+            *(asyncio.shield(future) for future in claim_futures)
+        )
+
+        if len(chunk_results) == 1:
+            return document_result, chunk_results[0]
+        return document_result, self.claim_extractor.merge_chunk_claims(chunk_results)
+
+    async def _fact_check_claims_shared(
+        self, claims: List[Claim]
+    ) -> List[FactCheckResult]:
+        """Fact-check claims, awaiting checks of the same claim already in flight"""
+        loop = asyncio.get_event_loop()
+        futures = []
+        owned = {}
+
+        for claim in claims:
+            key = (claim.text.lower().strip(), claim.claim_type.value)
+            future = self._inflight.get(key)
+            if future is None:
+                future = self._inflight[key] = loop.create_future()
+                owned[key] = (claim, future)
+            futures.append(future)
+
+        if owned:
+            # The check runs as its own task, so cancelling the document that
+            # started it doesn't cancel it for other documents awaiting the claim
+            task = loop.create_task(self._run_shared_check(owned))
+            self._shared_checks.add(task)
+            task.add_done_callback(partial(self._finish_shared_check, owned))
+
+        shared_results = await asyncio.gather(
+            *(asyncio.shield(future) for future in futures)
+        )
+
+        # Shared results carry the claim that was checked; rebind each to its own
+        return [
+            result if result.claim is claim else replace(result, claim=claim)
+            for claim, result in zip(claims, shared_results)
+        ]
+
+    async def _run_shared_check(
+        self, owned: Dict[Tuple[str, str], Tuple[Claim, asyncio.Future]]
+    ) -> None:
+        """Fact-check the claims owned by one request and settle their futures"""
+        try:
+            results = await self.fact_checker.fact_check_claims(
+                [claim for claim, _ in owned.values()]
+            )
+        except Exception as e:
+            for _, future in owned.values():
+                future.set_exception(e)
+        else:
+            for (_, future), result in zip(owned.values(), results):
+                future.set_result(result)
+
+    def _finish_shared_check(
+        self,
+        owned: Dict[Tuple[str, str], Tuple[Claim, asyncio.Future]],
+        task: asyncio.Task,
+    ) -> None:
+        """Release a finished shared check's in-flight entries"""
+        self._shared_checks.discard(task)
+        for key, (_, future) in owned.items():
+            if not future.done():
+                future.cancel()
+            elif not future.cancelled():
+                # Mark the outcome retrieved in case every requester went away
+                future.exception()
+            del self._inflight[key]
+
+    def _iter_scored_results(
+        self, fact_check_results: List[FactCheckResult], scoring_breakdowns: Iterator
+    ) -> Iterator[Dict[str, Any]]:
+        """Build the report entry for each fact-check result in order"""
+        for result in fact_check_results:
+            if result.verification_status != "error":
+                scoring_breakdown = next(scoring_breakdowns)
+
+                # Create comprehensive result
+                scored_result = {
+                    "claim": result.claim.as_report_dict(),
+                    "verification": scoring_breakdown.as_verification_dict(
+                        result.verification_status
+                    ),
+                    "scoring_breakdown": scoring_breakdown.as_breakdown_dict(),
+                    "sources": result.sources_checked,
+                    "evidence": result.evidence,
+                    "contradictions": result.contradictions,
+                    "processing_time": result.processing_time,
+                }
+            else:
+                # Handle error cases
+                scored_result = {
+                    "claim": {
+                        "text": result.claim.text,
+                        "type": result.claim.claim_type.value,
+                        "confidence": result.claim.confidence,
+                        "priority": result.claim.priority,
+                    },
+                    "verification": {
+                        "status": "error",
+                        "error_message": result.error_message,
+                    },
+                }
+
+            yield scored_result
+
+    def _summarize_to_stream(
+        self, scored_results: Iterable[Dict], stream_path: Union[str, Path]
+    ) -> Tuple[Counter, Dict[str, Any]]:
+        """Write scored results to an NDJSON file while summarizing them"""
+        with open(stream_path, "wb") as stream:
+
+            def _written(results):
+                for scored_result in results:
+                    stream.write(_dumps_line(scored_result))
+                    yield scored_result
+
+            return self._summarize(_written(scored_results))
+
+    def _summarize(
+        self, scored_results: Iterable[Dict]
+    ) -> Tuple[Counter, Dict[str, Any]]:
+        """Count verification statuses and calculate overall authenticity in one pass"""
+        status_counts = Counter()
+        scores = []
+        priorities = []
+
+        for result in scored_results:
+            verification = result["verification"]
+            status = verification["status"]
+            status_counts[status] += 1
+
+            # Only successful verifications contribute to the overall score
+            if status != "error" and "authenticity_score" in verification:
+                scores.append(verification["authenticity_score"])
+                priorities.append(result["claim"]["priority"])
+
+        if not status_counts:
+            overall_authenticity = {
                 "score": 0.0,
                 "level": "no_claims",
                 "recommendation": "No claims to verify",
             }
-
-        # Get successful verifications only
-        successful_results = [
-            r
-            for r in scored_results
-            if r["verification"]["status"] != "error"
-            and "authenticity_score" in r["verification"]
-        ]
-
-        if not successful_results:
-            return {
+        elif not scores:
+            overall_authenticity = {
                 "score": 0.0,
                 "level": "error",
                 "recommendation": "Unable to verify claims due to processing errors",
             }
-
-        # Calculate weighted average based on claim priority
-        total_weighted_score = 0.0
-        total_weight = 0.0
-
-        for result in successful_results:
-            score = result["verification"]["authenticity_score"]
-            priority = result["claim"]["priority"]
-
+        else:
             # Higher priority claims get more weight (priority 1 = weight 5, priority 5 = weight 1)
-            weight = 6 - priority
-
-            total_weighted_score += score * weight
-            total_weight += weight
+            weights = 6 - np.asarray(priorities, dtype=np.float64)
+            overall_authenticity = self._calculate_overall_authenticity(
+                float(np.average(scores, weights=weights)) if weights.sum() > 0 else 0.0
+            )
 
-        overall_score = total_weighted_score / total_weight if total_weight > 0 else 0.0
+        return status_counts, overall_authenticity
 
+    def _calculate_overall_authenticity(self, overall_score: float) -> Dict[str, Any]:
+        """Calculate overall document authenticity from the weighted claim score"""
         # Determine overall level
-        if overall_score >= 0.8:
-            level = "highly_authentic"
-            recommendation = "Document contains highly reliable information"
-        elif overall_score >= 0.6:
-            level = "mostly_authentic"
-            recommendation = (
-                "Document is generally reliable with some verification needed"
-            )
-        elif overall_score >= 0.4:
-            level = "mixed_authenticity"
-            recommendation = "Document contains mix of verified and unverified claims"
-        elif overall_score >= 0.2:
-            level = "low_authenticity"
-            recommendation = (
-                "Document contains questionable information - verify before use"
-            )
-        else:
-            level = "unreliable"
-            recommendation = "Document contains unreliable or false information"
+        level, recommendation = AUTHENTICITY_LEVELS[
+            bisect.bisect_right(AUTHENTICITY_THRESHOLDS, overall_score)
+        ]
 
         return {
             "score": overall_score,
@@ -377,56 +606,61 @@ class FactCheckAgent:
             fact_check_results = await self.fact_checker.fact_check_claims(claims)
 
             # Calculate scores and format results
-            formatted_results = []
-            for result in fact_check_results:
-                if result.verification_status != "error":
-                    scoring_breakdown = (
-                        self.authenticity_scorer.calculate_authenticity_score(
-                            claim_text=result.claim.text,
-                            claim_type=result.claim.claim_type.value,
-                            sources=result.sources_checked,
-                            evidence=result.evidence,
-                            contradictions=result.contradictions,
-                        )
-                    )
-
-                    formatted_result = {
-                        "claim": result.claim.text,
-                        "authenticity_score": scoring_breakdown.final_score,
-                        "authenticity_level": scoring_breakdown.authenticity_level.value,
-                        "explanation": scoring_breakdown.explanation,
-                        "sources_count": len(result.sources_checked),
-                        "evidence_count": len(result.evidence),
-                        "contradictions_count": len(result.contradictions),
-                        "evidence": [
-                            {
-                                "sentence": evidence.get("sentence", ""),
-                                "source_url": evidence.get("source_url", ""),
-                                "source_domain": evidence.get("source_domain", ""),
-                                "relevance_score": evidence.get("relevance_score", 0.0),
-                                "source_credibility": evidence.get("source_credibility", 0.0),
-                                "logical_reasoning": evidence.get("logical_reasoning", "Supports the claim based on content analysis"),
-                                "matched_keywords": evidence.get("matched_keywords", []),
-                                "supporting_indicators": evidence.get("supporting_indicators", [])
-                            }
-                            for evidence in result.evidence
-                        ],
-                        "contradictions": [
-                            {
-                                "sentence": contradiction.get("sentence", ""),
-                                "source_url": contradiction.get("source_url", ""),
-                                "source_domain": contradiction.get("source_domain", ""),
-                                "relevance_score": contradiction.get("relevance_score", 0.0),
-                                "source_credibility": contradiction.get("source_credibility", 0.0),
-                                "logical_reasoning": contradiction.get("logical_reasoning", "Contradicts the claim based on content analysis"),
-                                "matched_keywords": contradiction.get("matched_keywords", []),
-                                "contradictory_indicators": contradiction.get("contradictory_indicators", []),
-                                "contradiction_type": contradiction.get("contradiction_type", "general")
-                            }
-                            for contradiction in result.contradictions
-                        ],
+            successful_results = [
+                r for r in fact_check_results if r.verification_status != "error"
+            ]
+            scoring_breakdowns = self.authenticity_scorer.calculate_authenticity_scores_batch(
+                [
+                    {
+                        "claim_text": result.claim.text,
+                        "claim_type": result.claim.claim_type.value,
+                        "sources": result.sources_checked,
+                        "evidence": result.evidence,
+                        "contradictions": result.contradictions,
                     }
-                    formatted_results.append(formatted_result)
+                    for result in successful_results
+                ]
+            )
+
+            formatted_results = []
+            for result, scoring_breakdown in zip(successful_results, scoring_breakdowns):
+                formatted_result = {
+                    "claim": result.claim.text,
+                    "authenticity_score": scoring_breakdown.final_score,
+                    "authenticity_level": scoring_breakdown.authenticity_level.value,
+                    "explanation": scoring_breakdown.explanation,
+                    "sources_count": len(result.sources_checked),
+                    "evidence_count": len(result.evidence),
+                    "contradictions_count": len(result.contradictions),
+                    "evidence": [
+                        {
+                            "sentence": evidence.get("sentence", ""),
+                            "source_url": evidence.get("source_url", ""),
+                            "source_domain": evidence.get("source_domain", ""),
+                            "relevance_score": evidence.get("relevance_score", 0.0),
+                            "source_credibility": evidence.get("source_credibility", 0.0),
+                            "logical_reasoning": evidence.get("logical_reasoning", "Supports the claim based on content analysis"),
+                            "matched_keywords": evidence.get("matched_keywords", []),
+                            "supporting_indicators": evidence.get("supporting_indicators", [])
+                        }
+                        for evidence in result.evidence
+                    ],
+                    "contradictions": [
+                        {
+                            "sentence": contradiction.get("sentence", ""),
+                            "source_url": contradiction.get("source_url", ""),
+                            "source_domain": contradiction.get("source_domain", ""),
+                            "relevance_score": contradiction.get("relevance_score", 0.0),
+                            "source_credibility": contradiction.get("source_credibility", 0.0),
+                            "logical_reasoning": contradiction.get("logical_reasoning", "Contradicts the claim based on content analysis"),
+                            "matched_keywords": contradiction.get("matched_keywords", []),
+                            "contradictory_indicators": contradiction.get("contradictory_indicators", []),
+                            "contradiction_type": contradiction.get("contradiction_type", "general")
+                        }
+                        for contradiction in result.contradictions
+                    ],
+                }
+                formatted_results.append(formatted_result)
 
             return {"success": True, "results": formatted_results}
 
@@ -439,11 +673,14 @@ class FactCheckAgent:
         session_id = self.security_manager.create_secure_session(user_id, ip_address)
 
         # Also maintain legacy session format for compatibility
-        self.sessions[session_id] = {
-            "user_id": user_id,
-            "created_at": asyncio.get_event_loop().time(),
-            "history": [],
-        }
+        self.sessions.set(
+            session_id,
+            {
+                "user_id": user_id,
+                "created_at": time.monotonic(),
+                "history": deque(maxlen=50),
+            },
+        )
 
         return session_id
 
@@ -465,10 +702,10 @@ class FactCheckAgent:
                 return "Invalid or expired session. Please create a new session."
 
             # Validate legacy session
-            if session_id not in self.sessions:
+            session = self.sessions.get(session_id)
+            if session is None:
                 return "Session not found. Please create a new session."
 
-            session = self.sessions[session_id]
             if session["user_id"] != user_id:
                 return "Invalid session for this user."
 
@@ -476,21 +713,10 @@ class FactCheckAgent:
             safe_message = self.security_manager.anonymize_sensitive_data(message)
 
             # Prepare context for fact-checking
-            context_prompt = f"""
-            You are a fact-checking AI assistant. Your role is to help users understand fact-checking processes, 
-            provide information about document analysis, and explain authenticity scoring.
-            
-            User question: {safe_message}
-            
-            Guidelines:
-            - Be helpful and informative about fact-checking
-            - Explain how the system works when asked
-            - Suggest document analysis when appropriate
-            - Be concise but thorough
-            """
+            context_prompt = CHAT_PROMPT_TEMPLATE.format_map({"message": safe_message})
 
             # Generate response using Vertex AI
-            response = self.model.generate_content(context_prompt)
+            response = await self.model.generate_content_async(context_prompt)
             response_text = response.text
 
             # Store in session history
@@ -498,7 +724,7 @@ class FactCheckAgent:
                 {
                     "user": message,
                     "assistant": response_text,
-                    "timestamp": asyncio.get_event_loop().time(),
+                    "timestamp": time.monotonic(),
                 }
             )
 
@@ -628,13 +854,26 @@ class FactCheckAgent:
         Returns:
             List of analysis results
         """
-        # Update concurrent limit
-        self.performance_monitor.max_concurrent = max_concurrent
+        # Per-call limit, independent of the shared performance monitor
+        semaphore = asyncio.Semaphore(max_concurrent)
 
         async def process_single_doc(doc_path):
-            return await with_throttling(
-                self.analyze_document(doc_path, user_id, session_id)
-            )
+            async with semaphore:
+                try:
+                    # A hung document must not hold its slot forever
+                    return await asyncio.wait_for(
+                        self.analyze_document(doc_path, user_id, session_id),
+                        timeout=config.document_timeout_seconds,
+                    )
+                except asyncio.CancelledError:
+                    raise
+                except asyncio.TimeoutError:
+                    logger.warning(f"Document analysis timed out: {doc_path}")
+                    return {
+                        "success": False,
+                        "error": "timeout",
+                        "document_path": str(doc_path),
+                    }
 
         # Process documents with concurrency control
         tasks = [process_single_doc(doc_path) for doc_path in document_paths]
@@ -669,6 +908,36 @@ def get_fact_check_agent() -> FactCheckAgent:
     return fact_check_agent
 
 
+def _dumps_result(result: Dict[str, Any]) -> str:
+    """Serialize an agent result as indented JSON, using orjson when available"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                result,
+                option=orjson.OPT_INDENT_2
+                | orjson.OPT_SERIALIZE_NUMPY
+                | orjson.OPT_NON_STR_KEYS,
+            ).decode()
+        except TypeError:
+            pass  # e.g. values orjson cannot serialize
+    return json.dumps(result, indent=2)
+
+
+def _dumps_line(result: Dict[str, Any]) -> bytes:
+    """Serialize one result as a newline-terminated JSON line"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                result,
+                option=orjson.OPT_APPEND_NEWLINE
+                | orjson.OPT_SERIALIZE_NUMPY
+                | orjson.OPT_NON_STR_KEYS,
+            )
+        except TypeError:
+            pass  # e.g. values orjson cannot serialize
+    return (json.dumps(result) + "\n").encode()
+
+
 # Agent functions for document analysis and fact-checking
 async def analyze_document_function(
     document_path: str, user_id: str = "default_user"
@@ -685,7 +954,7 @@ async def analyze_document_function(
     """
     agent = get_fact_check_agent()
     result = await agent.analyze_document(document_path, user_id)
-    return json.dumps(result, indent=2)
+    return _dumps_result(result)
 
 
 async def fact_check_text_function(text: str, user_id: str = "default_user") -> str:
@@ -701,7 +970,7 @@ async def fact_check_text_function(text: str, user_id: str = "default_user") ->
     """
     agent = get_fact_check_agent()
     result = await agent.fact_check_text(text, user_id)
-    return json.dumps(result, indent=2)
+    return _dumps_result(result)
 
 
 def get_supported_formats() -> str:
@@ -3,122 +3,151 @@ Intelligent Query Optimization with Claim-Type Specific Strategies
 Reduces query execution time through smart query generation and optimization
 """
 import re
+import heapq
 import logging
 from typing import List, Dict, Any, Set, Tuple, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from collections import defaultdict
 import hashlib
 
 from .claim_extractor import Claim, ClaimType
+from .performance_cache import HighPerformanceCache
 
 logger = logging.getLogger(__name__)
 
+_DIGITS = frozenset('0123456789')
+
+# ASCII characters outside [\w\s%$-], deleted by _clean_query's str.translate fast path
+_ASCII_PUNCT_TABLE = {
+    i: None for i in range(128)
+    if not (chr(i).isalnum() or chr(i).isspace() or chr(i) in '_%$-')
+}
+
 @dataclass
 class OptimizedQuery:
     """Represents an optimized search query"""
+    __slots__ = ('query', 'priority', 'query_type', 'expected_domains', 'confidence')
+    
     query: str
     priority: int  # 1 (highest) to 5 (lowest)
     query_type: str  # 'fact_check', 'source_specific', 'entity_based', 'general'
-    expected_domains: List[str]
+    expected_domains: Tuple[str, ...]
     confidence: float  # Expected relevance (0.0 to 1.0)
 
+@dataclass(frozen=True)
+class QueryStrategy:
+    """Claim-type specific query generation settings"""
+    priority_sources: Tuple[str, ...]
+    query_templates: Tuple[str, ...]
+    key_terms: Tuple[str, ...]
+    avoid_terms: Tuple[str, ...]
+    max_queries: int = 2
+
 class IntelligentQueryOptimizer:
     """Advanced query optimization with claim-type specific strategies"""
     
+    # Precompiled patterns for the per-claim extraction and per-query cleaning paths
+    _WORD_RE = re.compile(r'\b[a-zA-Z]{3,}\b')
+    _CONDITION_RE = re.compile(
+        r'\b(?:effective|safe|dangerous|beneficial|harmful|increased|decreased|new|old)\b',
+        re.IGNORECASE
+    )
+    _PUNCT_RE = re.compile(r'[^\w\s%$-]')
+    
     def __init__(self):
         """Initialize intelligent query optimizer"""
         
         # Claim-type specific optimization strategies
         self.claim_type_strategies = {
-            ClaimType.MEDICAL: {
-                'priority_sources': ['who.int', 'cdc.gov', 'nih.gov', 'mayoclinic.org', 'webmd.com'],
-                'query_templates': [
+            ClaimType.MEDICAL: QueryStrategy(
+                priority_sources=('who.int', 'cdc.gov', 'nih.gov', 'mayoclinic.org', 'webmd.com'),
+                query_templates=(
                     'medical fact check {entity} {condition}',
                     'WHO CDC {entity} guidelines',
                     '{entity} medical research study',
                     'health {entity} clinical trial'
-                ],
-                'key_terms': ['study', 'research', 'clinical', 'trial', 'guideline', 'recommendation'],
-                'avoid_terms': ['opinion', 'blog', 'personal'],
-                'max_queries': 2
-            },
-            ClaimType.SCIENTIFIC: {
-                'priority_sources': ['nature.com', 'science.org', 'ncbi.nlm.nih.gov', 'ieee.org'],
-                'query_templates': [
+                ),
+                key_terms=('study', 'research', 'clinical', 'trial', 'guideline', 'recommendation'),
+                avoid_terms=('opinion', 'blog', 'personal'),
+                max_queries=2
+            ),
+            ClaimType.SCIENTIFIC: QueryStrategy(
+                priority_sources=('nature.com', 'science.org', 'ncbi.nlm.nih.gov', 'ieee.org'),
+                query_templates=(
                     'scientific study {entity} research',
                     'peer reviewed {entity} journal',
                     '{entity} academic paper',
                     'research {entity} findings'
-                ],
-                'key_terms': ['research', 'study', 'journal', 'peer-reviewed', 'academic'],
-                'avoid_terms': ['opinion', 'blog', 'unverified'],
-                'max_queries': 2
-            },
-            ClaimType.POLITICAL: {
-                'priority_sources': ['reuters.com', 'apnews.com', 'factcheck.org', 'politifact.com'],
-                'query_templates': [
+                ),
+                key_terms=('research', 'study', 'journal', 'peer-reviewed', 'academic'),
+                avoid_terms=('opinion', 'blog', 'unverified'),
+                max_queries=2
+            ),
+            ClaimType.POLITICAL: QueryStrategy(
+                priority_sources=('reuters.com', 'apnews.com', 'factcheck.org', 'politifact.com'),
+                query_templates=(
                     'fact check {entity} political claim',
                     '{entity} voting record policy',
                     'political fact {entity} verification',
                     'government {entity} official statement'
-                ],
-                'key_terms': ['fact check', 'verification', 'official', 'statement'],
-                'avoid_terms': ['opinion', 'editorial', 'partisan'],
-                'max_queries': 3
-            },
-            ClaimType.FINANCIAL: {
-                'priority_sources': ['reuters.com', 'sec.gov', 'federalreserve.gov'],
-                'query_templates': [
+                ),
+                key_terms=('fact check', 'verification', 'official', 'statement'),
+                avoid_terms=('opinion', 'editorial', 'partisan'),
+                max_queries=3
+            ),
+            ClaimType.FINANCIAL: QueryStrategy(
+                priority_sources=('reuters.com', 'sec.gov', 'federalreserve.gov'),
+                query_templates=(
                     '{entity} financial report SEC',
                     'stock market {entity} data',
                     '{entity} earnings financial',
                     'economic {entity} statistics'
-                ],
-                'key_terms': ['financial', 'earnings', 'SEC', 'report', 'data'],
-                'avoid_terms': ['prediction', 'opinion', 'speculation'],
-                'max_queries': 2
-            },
-            ClaimType.STATISTICAL: {
-                'priority_sources': ['bls.gov', 'census.gov', 'who.int', 'worldbank.org'],
-                'query_templates': [
+                ),
+                key_terms=('financial', 'earnings', 'SEC', 'report', 'data'),
+                avoid_terms=('prediction', 'opinion', 'speculation'),
+                max_queries=2
+            ),
+            ClaimType.STATISTICAL: QueryStrategy(
+                priority_sources=('bls.gov', 'census.gov', 'who.int', 'worldbank.org'),
+                query_templates=(
                     '{entity} government statistics data',
                     'official {entity} census bureau',
                     '{entity} statistical report',
                     'government data {entity} official'
-                ],
-                'key_terms': ['statistics', 'data', 'official', 'government', 'census'],
-                'avoid_terms': ['estimate', 'projection', 'opinion'],
-                'max_queries': 2
-            },
-            ClaimType.TECHNOLOGY: {
-                'priority_sources': ['ieee.org', 'techcrunch.com', 'arstechnica.com'],
-                'query_templates': [
+                ),
+                key_terms=('statistics', 'data', 'official', 'government', 'census'),
+                avoid_terms=('estimate', 'projection', 'opinion'),
+                max_queries=2
+            ),
+            ClaimType.TECHNOLOGY: QueryStrategy(
+                priority_sources=('ieee.org', 'techcrunch.com', 'arstechnica.com'),
+                query_templates=(
                     '{entity} technology research',
                     'tech {entity} development',
                     '{entity} innovation study',
                     'technology {entity} report'
-                ],
-                'key_terms': ['technology', 'research', 'development', 'innovation'],
-                'avoid_terms': ['rumor', 'speculation', 'leak'],
-                'max_queries': 2
-            }
+                ),
+                key_terms=('technology', 'research', 'development', 'innovation'),
+                avoid_terms=('rumor', 'speculation', 'leak'),
+                max_queries=2
+            )
         }
         
         # Default strategy for general claims
-        self.default_strategy = {
-            'priority_sources': ['reuters.com', 'apnews.com', 'bbc.com', 'factcheck.org'],
-            'query_templates': [
+        self.default_strategy = QueryStrategy(
+            priority_sources=('reuters.com', 'apnews.com', 'bbc.com', 'factcheck.org'),
+            query_templates=(
                 'fact check {entity}',
                 '{entity} news verification',
                 '{entity} reliable source'
-            ],
-            'key_terms': ['fact', 'verify', 'source', 'news'],
-            'avoid_terms': ['opinion', 'blog', 'rumor'],
-            'max_queries': 2
-        }
+            ),
+            key_terms=('fact', 'verify', 'source', 'news'),
+            avoid_terms=('opinion', 'blog', 'rumor'),
+            max_queries=2
+        )
         
-        # Entity type patterns for better extraction
-        self.entity_patterns = {
+        # Entity type patterns for better extraction (compiled below)
+        entity_patterns = {
             'person': r'\b[A-Z][a-z]+ [A-Z][a-z]+\b',
             'organization': r'\b[A-Z]{2,}|[A-Z][a-z]+ (?:Inc|Corp|LLC|Organization|Agency|Department)\b',
             'location': r'\b[A-Z][a-z]+ (?:City|State|Country|County)\b',
@@ -127,33 +156,80 @@ class IntelligentQueryOptimizer:
             'money': r'\$\d+(?:,\d{3})*(?:\.\d{2})?\b',
             'number': r'\b\d+(?:,\d{3})*(?:\.\d+)?\b'
         }
+        self.entity_patterns = {
+            entity_type: re.compile(pattern) for entity_type, pattern in entity_patterns.items()
+        }
+        # Patterns that can only match text containing a digit
+        self.numeric_entity_types = frozenset(('date', 'percentage', 'money', 'number'))
         
         # Query quality metrics
-        self.stop_words = {
+        self.stop_words = frozenset({
             'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from',
             'has', 'he', 'in', 'is', 'it', 'its', 'of', 'on', 'that', 'the',
             'to', 'was', 'will', 'with', 'the', 'this', 'they', 'have', 'had'
-        }
+        })
         
         # Performance settings
         self.max_total_queries = 3  # Global limit
         self.min_query_length = 10
         self.max_query_length = 100
+        
+        # Query generation is deterministic, so repeated claims are served from here
+        self._query_cache = HighPerformanceCache(max_size=4096, default_ttl=3600)
     
     def optimize_queries(self, claim: Claim) -> List[OptimizedQuery]:
         """Generate optimized queries for a claim using intelligent strategies"""
+        cached = self._cached_queries(claim, self._query_cache_key(claim))
         
+        # Copies, so callers mutating results can't corrupt the cache
+        return [replace(query) for query in cached]
+    
+    def optimize_queries_batch(self, claims: List[Claim]) -> List[List[OptimizedQuery]]:
+        """Generate optimized queries for many claims, running the pipeline once per distinct claim"""
+        generated: Dict[Tuple, Tuple[OptimizedQuery, ...]] = {}
+        results = []
+        
+        for claim in claims:
+            cache_key = self._query_cache_key(claim)
+            cached = generated.get(cache_key)
+            if cached is None:
+                cached = generated[cache_key] = self._cached_queries(claim, cache_key)
+            results.append([replace(query) for query in cached])
+        
+        return results
+    
+    def _query_cache_key(self, claim: Claim) -> Tuple:
+        """Cache key for a claim: only the text, type and entities feed into the generated queries"""
+        return (
+            claim.text,
+            claim.claim_type,
+            tuple((entity.get('text', ''), entity.get('label', 'UNKNOWN')) for entity in claim.entities)
+        )
+    
+    def _cached_queries(self, claim: Claim, cache_key: Tuple) -> Tuple[OptimizedQuery, ...]:
+        """Generated queries for a claim, from the query cache when available"""
+        cached = self._query_cache.get(cache_key)
+        if cached is None:
+            cached = tuple(self._generate_optimized_queries(claim))
+            self._query_cache.set(cache_key, cached)
+        return cached
+    
+    def _generate_optimized_queries(self, claim: Claim) -> List[OptimizedQuery]:
+        """Run the full query generation pipeline for a claim"""
         strategy = self.claim_type_strategies.get(claim.claim_type, self.default_strategy)
         
         # Extract key entities and terms
         entities = self._extract_key_entities(claim)
-        key_terms = self._extract_key_terms(claim, strategy['key_terms'])
+        key_terms = self._extract_key_terms(claim, strategy.key_terms)
+        
+        # Most important entity, shared by the template and fact-check queries
+        primary_entity = self._get_primary_entity(entities)
         
         # Generate optimized queries
         optimized_queries = []
         
         # 1. Generate template-based queries
-        template_queries = self._generate_template_queries(claim, entities, strategy)
+        template_queries = self._generate_template_queries(claim, primary_entity, strategy)
         optimized_queries.extend(template_queries)
         
         # 2. Generate entity-based queries
@@ -161,7 +237,7 @@ class IntelligentQueryOptimizer:
         optimized_queries.extend(entity_queries)
         
         # 3. Generate fact-check specific queries
-        fact_check_queries = self._generate_fact_check_queries(claim, entities, strategy)
+        fact_check_queries = self._generate_fact_check_queries(claim, primary_entity, strategy)
         optimized_queries.extend(fact_check_queries)
         
         # 4. Rank and filter queries
@@ -192,19 +268,27 @@ class IntelligentQueryOptimizer:
         
         # Extract additional entities using patterns
         text = claim.text
+        has_digits = not _DIGITS.isdisjoint(text)
         
         for entity_type, pattern in self.entity_patterns.items():
-            matches = re.findall(pattern, text)
+            if not has_digits and entity_type in self.numeric_entity_types:
+                continue
+            # First 3 distinct matches in order of appearance; the rest would be cut anyway
+            matches = {}
+            for match in pattern.finditer(text):
+                matches[match.group()] = None
+                if len(matches) == 3:
+                    break
             if matches:
                 entities[entity_type].extend(matches)
         
-        # Clean and deduplicate
+        # Clean and deduplicate (order-preserving, so the first mention leads)
         for entity_type in entities:
-            entities[entity_type] = list(set(entities[entity_type]))[:3]  # Limit to top 3
+            entities[entity_type] = list(dict.fromkeys(entities[entity_type]))[:3]  # Limit to top 3
         
         return dict(entities)
     
-    def _extract_key_terms(self, claim: Claim, strategy_terms: List[str]) -> List[str]:
+    def _extract_key_terms(self, claim: Claim, strategy_terms: Tuple[str, ...]) -> List[str]:
         """Extract key terms relevant to the claim type"""
         key_terms = []
         
@@ -212,14 +296,15 @@ class IntelligentQueryOptimizer:
         if claim.keywords:
             key_terms.extend(claim.keywords[:3])
         
+        # Lowercase the claim once for both the word scan and the term checks
+        text_lower = claim.text.lower()
+        
         # Extract important words from claim text
-        words = re.findall(r'\b[a-zA-Z]{3,}\b', claim.text.lower())
+        words = self._WORD_RE.findall(text_lower)
         important_words = [w for w in words if w not in self.stop_words and len(w) > 3]
         
         # Prioritize strategy-specific terms
-        for term in strategy_terms:
-            if term.lower() in claim.text.lower():
-                key_terms.append(term)
+        key_terms.extend(term for term in strategy_terms if term.lower() in text_lower)
         
         # Add other important words
         key_terms.extend(important_words[:5])
@@ -229,24 +314,21 @@ class IntelligentQueryOptimizer:
     def _generate_template_queries(
         self, 
         claim: Claim, 
-        entities: Dict[str, List[str]], 
-        strategy: Dict[str, Any]
+        primary_entity: str, 
+        strategy: QueryStrategy
     ) -> List[OptimizedQuery]:
         """Generate queries using claim-type specific templates"""
         queries = []
         
-        templates = strategy['query_templates']
+        templates = strategy.query_templates
         
-        # Get primary entity for template substitution
-        primary_entity = self._get_primary_entity(entities)
+        # Condition for template substitution (same for every template)
+        condition = self._extract_condition(claim.text)
         
         for template in templates[:2]:  # Limit templates
             try:
                 # Simple template substitution
-                query = template.format(
-                    entity=primary_entity,
-                    condition=self._extract_condition(claim.text)
-                )
+                query = template.format(entity=primary_entity, condition=condition)
                 
                 # Clean the query
                 query = self._clean_query(query)
@@ -256,7 +338,7 @@ class IntelligentQueryOptimizer:
                         query=query,
                         priority=1,  # High priority for template queries
                         query_type='template_based',
-                        expected_domains=strategy['priority_sources'],
+                        expected_domains=strategy.priority_sources,
                         confidence=0.8
                     )
                     queries.append(optimized_query)
@@ -271,7 +353,7 @@ class IntelligentQueryOptimizer:
         self, 
         claim: Claim, 
         entities: Dict[str, List[str]], 
-        strategy: Dict[str, Any]
+        strategy: QueryStrategy
     ) -> List[OptimizedQuery]:
         """Generate entity-focused queries"""
         queries = []
@@ -292,7 +374,7 @@ class IntelligentQueryOptimizer:
                     query=query,
                     priority=2,
                     query_type='entity_based',
-                    expected_domains=strategy['priority_sources'],
+                    expected_domains=strategy.priority_sources,
                     confidence=0.7
                 )
                 queries.append(optimized_query)
@@ -307,7 +389,7 @@ class IntelligentQueryOptimizer:
                         query=query,
                         priority=2,
                         query_type='entity_number',
-                        expected_domains=strategy['priority_sources'],
+                        expected_domains=strategy.priority_sources,
                         confidence=0.75
                     )
                     queries.append(optimized_query)
@@ -317,14 +399,12 @@ class IntelligentQueryOptimizer:
     def _generate_fact_check_queries(
         self, 
         claim: Claim, 
-        entities: Dict[str, List[str]], 
-        strategy: Dict[str, Any]
+        primary_entity: str, 
+        strategy: QueryStrategy
     ) -> List[OptimizedQuery]:
         """Generate fact-check specific queries"""
         queries = []
         
-        primary_entity = self._get_primary_entity(entities)
-        
         # Fact-check query
         query = f"fact check {primary_entity}"
         query = self._clean_query(query)
@@ -334,7 +414,7 @@ class IntelligentQueryOptimizer:
                 query=query,
                 priority=1,  # High priority for fact-check queries
                 query_type='fact_check',
-                expected_domains=['factcheck.org', 'snopes.com', 'politifact.com'],
+                expected_domains=('factcheck.org', 'snopes.com', 'politifact.com'),
                 confidence=0.9
             )
             queries.append(optimized_query)
@@ -348,7 +428,7 @@ class IntelligentQueryOptimizer:
                 query=query,
                 priority=2,
                 query_type='verification',
-                expected_domains=strategy['priority_sources'],
+                expected_domains=strategy.priority_sources,
                 confidence=0.7
             )
             queries.append(optimized_query)
@@ -378,8 +458,7 @@ class IntelligentQueryOptimizer:
         descriptors = []
         
         # Look for adjectives and important terms
-        pattern = r'\b(?:effective|safe|dangerous|beneficial|harmful|increased|decreased|new|old)\b'
-        matches = re.findall(pattern, text, re.IGNORECASE)
+        matches = self._CONDITION_RE.findall(text)
         
         if matches:
             return matches[0]
@@ -389,10 +468,13 @@ class IntelligentQueryOptimizer:
     def _clean_query(self, query: str) -> str:
         """Clean and optimize query string"""
         # Remove extra spaces
-        query = re.sub(r'\s+', ' ', query)
+        query = ' '.join(query.split())
         
-        # Remove special characters that might interfere with search
-        query = re.sub(r'[^\w\s%$-]', '', query)
+        # Remove special characters that might interfere with search (table lookup for ASCII queries)
+        if query.isascii():
+            query = query.translate(_ASCII_PUNCT_TABLE)
+        else:
+            query = self._PUNCT_RE.sub('', query)
         
         # Truncate if too long
         if len(query) > self.max_query_length:
@@ -402,17 +484,17 @@ class IntelligentQueryOptimizer:
     
     def _is_valid_query(self, query: str) -> bool:
         """Check if query is valid for search"""
+        # maxsplit=1 stops at the second word, and only the prefix is lowercased for the URL check
         return (
-            len(query) >= self.min_query_length and
-            len(query) <= self.max_query_length and
-            len(query.split()) >= 2 and
-            not query.lower().startswith('http')
+            self.min_query_length <= len(query) <= self.max_query_length and
+            len(query.split(None, 1)) == 2 and
+            query[:4].lower() != 'http'
         )
     
     def _rank_and_filter_queries(
         self, 
         queries: List[OptimizedQuery], 
-        strategy: Dict[str, Any]
+        strategy: QueryStrategy
     ) -> List[OptimizedQuery]:
         """Rank and filter queries based on quality and strategy"""
         
@@ -426,13 +508,8 @@ class IntelligentQueryOptimizer:
                 seen_queries.add(query_key)
                 unique_queries.append(query)
         
-        # Sort by priority and confidence
-        unique_queries.sort(key=lambda q: (q.priority, -q.confidence))
-        
-        # Apply strategy limits
-        max_queries = strategy.get('max_queries', 2)
-        
-        return unique_queries[:max_queries]
+        # Best queries by priority and confidence, within the strategy limit (stable, like sort + slice)
+        return heapq.nsmallest(strategy.max_queries, unique_queries, key=lambda q: (q.priority, -q.confidence))
     
     def get_query_optimization_stats(self) -> Dict[str, Any]:
         """Get query optimization statistics"""
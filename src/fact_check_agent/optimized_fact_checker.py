@@ -317,7 +317,7 @@ class OptimizedFactChecker:
         cache_hits = 0
         
         # Generate cache key for entire search
-        search_key = f"search_{claim.claim_type.value}_{hashlib.md5(claim.text.encode()).hexdigest()[:8]}"
+        search_key = f"search_{claim.claim_type.value}_{hashlib.md5(claim.text.encode()).hexdigest()}"
         
         # Try to get cached search results
         cached_sources = search_cache.get(search_key)
@@ -388,7 +388,7 @@ class OptimizedFactChecker:
     
     async def _search_priority_domain(self, query: str, domain: str) -> List[Source]:
         """Search priority domain with caching"""
-        cache_key = f"domain_{domain}_{hashlib.md5(query.encode()).hexdigest()[:8]}"
+        cache_key = f"domain_{domain}_{hashlib.md5(query.encode()).hexdigest()}"
         
         cached_result = search_cache.get(cache_key)
         if cached_result:
@@ -408,7 +408,7 @@ class OptimizedFactChecker:
     
     async def _fast_web_search(self, query: str, claim_type: ClaimType) -> List[Source]:
         """Ultra-fast web search with aggressive caching"""
-        cache_key = f"web_{claim_type.value}_{hashlib.md5(query.encode()).hexdigest()[:8]}"
+        cache_key = f"web_{claim_type.value}_{hashlib.md5(query.encode()).hexdigest()}"
         
         cached_result = search_cache.get(cache_key)
         if cached_result:
@@ -2,6 +2,7 @@
 High-performance caching system for fact-checking operations
 Implements Redis-like in-memory caching with TTL support
 """
+import os
 import time
 import threading
 import hashlib
@@ -11,8 +12,33 @@ from typing import Dict, Any, Optional, List
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+from .config import config
+
 logger = logging.getLogger(__name__)
 
+def _dumps_key(key_data: Any) -> bytes:
+    """Serialize cache key data deterministically, using orjson when available"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                key_data,
+                default=str,
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            )
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits
+    return json.dumps(key_data, sort_keys=True, default=str).encode()
+
 @dataclass
 class CacheEntry:
     """Cache entry with TTL support"""
@@ -60,8 +86,7 @@ class HighPerformanceCache:
             'args': args,
             'kwargs': sorted(kwargs.items())
         }
-        key_str = json.dumps(key_data, sort_keys=True, default=str)
-        return hashlib.md5(key_str.encode()).hexdigest()
+        return hashlib.md5(_dumps_key(key_data)).hexdigest()
     
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache"""
@@ -181,10 +206,87 @@ class HighPerformanceCache:
             return wrapper
         return decorator
 
+class PersistentCache(HighPerformanceCache):
+    """In-memory cache backed by an on-disk store that survives restarts and is shared across processes"""
+    
+    def __init__(self, directory: str, max_size: int = 1000, default_ttl: float = 3600):
+        """
+        Initialize cache
+        
+        Args:
+            directory: On-disk store location; empty (or diskcache missing) keeps the cache in memory only
+            max_size: Maximum number of in-memory entries
+            default_ttl: Default TTL in seconds (1 hour)
+        """
+        super().__init__(max_size=max_size, default_ttl=default_ttl)
+        self._disk = None
+        self._disk_hits = 0
+        
+        if directory and diskcache is not None:
+            try:
+                self._disk = diskcache.Cache(os.path.expanduser(directory))
+            except Exception as e:
+                logger.warning(f"Persistent cache unavailable at {directory}: {str(e)}")
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Get value from memory, falling back to the on-disk store"""
+        value = super().get(key)
+        if value is not None or self._disk is None:
+            return value
+        
+        try:
+            value, expire_time = self._disk.get(key, expire_time=True)
+        except Exception as e:
+            logger.debug(f"Persistent cache read failed: {str(e)}")
+            return None
+        
+        if value is not None:
+            # Promote into memory for the rest of its remaining lifetime
+            remaining = expire_time - time.time() if expire_time else self.default_ttl
+            super().set(key, value, max(remaining, 0.0))
+            with self._lock:
+                self._disk_hits += 1
+        return value
+    
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Set value in memory and in the on-disk store"""
+        if ttl is None:
+            ttl = self.default_ttl
+        
+        super().set(key, value, ttl)
+        if self._disk is not None:
+            try:
+                self._disk.set(key, value, expire=ttl)
+            except Exception as e:
+                logger.debug(f"Persistent cache write failed: {str(e)}")
+    
+    def clear(self) -> None:
+        """Clear all cache entries, including the on-disk store"""
+        super().clear()
+        with self._lock:
+            self._disk_hits = 0
+        if self._disk is not None:
+            try:
+                self._disk.clear()
+            except Exception as e:
+                logger.debug(f"Persistent cache clear failed: {str(e)}")
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        stats = super().stats()
+        stats['disk_hits'] = self._disk_hits
+        stats['persistent'] = self._disk is not None
+        return stats
+
+def _cache_subdir(name: str) -> str:
+    """On-disk location for a named cache, or '' when persistence is disabled"""
+    return os.path.join(config.cache_dir, name) if config.cache_dir else ""
+
 # Global cache instances
-search_cache = HighPerformanceCache(max_size=500, default_ttl=1800)  # 30 minutes
-content_cache = HighPerformanceCache(max_size=1000, default_ttl=3600)  # 1 hour
+search_cache = PersistentCache(_cache_subdir("search"), max_size=500, default_ttl=1800)  # 30 minutes
+content_cache = PersistentCache(_cache_subdir("content"), max_size=1000, default_ttl=3600)  # 1 hour
 source_cache = HighPerformanceCache(max_size=2000, default_ttl=7200)  # 2 hours
+html_cache = HighPerformanceCache(max_size=200, default_ttl=86400)  # 24 hours, raw pages for revalidation
 
 def get_cache_stats() -> Dict[str, Any]:
     """Get statistics for all caches"""
@@ -192,10 +294,12 @@ def get_cache_stats() -> Dict[str, Any]:
         'search_cache': search_cache.stats(),
         'content_cache': content_cache.stats(),
         'source_cache': source_cache.stats(),
+        'html_cache': html_cache.stats(),
         'total_memory_mb': (
             search_cache.stats()['size'] + 
             content_cache.stats()['size'] + 
-            source_cache.stats()['size']
+            source_cache.stats()['size'] +
+            html_cache.stats()['size'] * 200  # Raw pages are up to ~200KB each
         ) * 0.001  # Rough estimation
     }
 
@@ -204,4 +308,5 @@ def clear_all_caches() -> None:
     search_cache.clear()
     content_cache.clear()
     source_cache.clear()
+    html_cache.clear()
     logger.info("All caches cleared")
\ No newline at end of file
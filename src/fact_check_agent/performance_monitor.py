@@ -36,6 +36,9 @@ class PerformanceMonitor:
             @wraps(func)
             async def async_wrapper(*args, **kwargs):
                 start_time = time.time()
+                # Cancellation isn't an Exception; record it as a failure
+                success = False
+                error = "cancelled"
                 try:
                     result = await func(*args, **kwargs)
                     success = True
@@ -124,7 +124,7 @@ class UnifiedSearchService:
         max_results = max_results or self.max_results
         
         # Check cache first
-        cache_key = f"unified_search_{hashlib.md5(query.encode()).hexdigest()[:12]}_{max_results}"
+        cache_key = f"unified_search_{hashlib.md5(query.encode()).hexdigest()}_{max_results}"
         cached_response = search_cache.get(cache_key)
         if cached_response:
             cached_response['cache_hit'] = True
@@ -247,7 +247,9 @@ class UnifiedSearchService:
                 "safe": "active"
             })
             
-            results_dict = search.get_dict()
+            # get_dict() is a blocking HTTP call; run it in the thread pool
+            loop = asyncio.get_event_loop()
+            results_dict = await loop.run_in_executor(None, search.get_dict)
             
             if "error" in results_dict:
                 raise SearchProviderError(f"SERP API error: {results_dict['error']}")
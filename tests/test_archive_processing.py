@@ -0,0 +1,113 @@
+"""
+Tests for archive member processing
+"""
+
+import sys
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add src to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+document_processor = pytest.importorskip("fact_check_agent.document_processor")
+DocumentProcessor = document_processor.DocumentProcessor
+
+
+@pytest.fixture
+def archive(tmp_path):
+    """ZIP with text members, including same-named files in different folders"""
+    path = tmp_path / "bundle.zip"
+    with zipfile.ZipFile(path, "w") as zip_ref:
+        for index in range(6):
+            zip_ref.writestr(f"part{index}/notes.txt", f"Member number {index}")
+    return path
+
+
+def test_pool_submissions_are_bounded(archive):
+    """Only a few members per worker are held in flight at once"""
+    processor = DocumentProcessor()
+    processor._archive_workers = 1
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def slow_worker(data, filename):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return {"success": True, "text": data.decode()}
+
+    with ThreadPoolExecutor(max_workers=6) as pool, patch.object(
+        processor, "_get_archive_pool", return_value=pool
+    ), patch.object(document_processor, "_process_document_worker", slow_worker):
+        result = processor._process_archive(archive)
+
+    assert peak <= document_processor.ARCHIVE_MEMBERS_PER_WORKER
+    assert result["metadata"]["total_extracted"] == 6
+    assert result["text"].index("Member number 0") < result["text"].index(
+        "Member number 5"
+    )
+
+
+def test_nested_archives_run_inline_in_workers(archive):
+    """A processor inside a pool worker never starts its own pool"""
+    processor = DocumentProcessor(parallel_archives=False)
+
+    with patch.object(
+        processor, "_get_archive_pool", side_effect=AssertionError("pool started")
+    ):
+        result = processor._process_archive(archive)
+
+    assert result["metadata"]["total_extracted"] == 6
+    for index in range(6):
+        assert f"Member number {index}" in result["text"]
+
+
+def test_iter_archive_members_keeps_archive_order(tmp_path):
+    """Supported members stream in archive order; others are skipped"""
+    path = tmp_path / "mixed.zip"
+    with zipfile.ZipFile(path, "w") as zip_ref:
+        zip_ref.writestr("b/report.txt", "second")
+        zip_ref.writestr("a/report.txt", "first")
+        zip_ref.writestr("tool.exe", "binary")
+        zip_ref.writestr("nested.zip", "archive")
+        zip_ref.writestr("c/summary.md", "third")
+
+    processor = DocumentProcessor(parallel_archives=False)
+    members = list(processor._iter_archive_members(path, "zip"))
+
+    assert members == [
+        ("b/report.txt", b"second"),
+        ("a/report.txt", b"first"),
+        ("c/summary.md", b"third"),
+    ]
+
+
+def test_sections_sorted_by_member_path_not_completion(archive):
+    """Sections follow member paths even when later members finish first"""
+    processor = DocumentProcessor()
+
+    def reversed_worker(data, filename):
+        # Earlier members take longer, so they complete last
+        time.sleep(0.01 * (6 - int(filename[4])))
+        return {"success": True, "text": data.decode()}
+
+    with ThreadPoolExecutor(max_workers=6) as pool, patch.object(
+        processor, "_get_archive_pool", return_value=pool
+    ), patch.object(document_processor, "_process_document_worker", reversed_worker):
+        result = processor._process_archive(archive)
+
+    positions = [result["text"].index(f"Member number {i}") for i in range(6)]
+    assert positions == sorted(positions)
+    assert result["metadata"]["extracted_files"] == ["notes.txt"] * 6
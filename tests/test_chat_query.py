@@ -0,0 +1,60 @@
+"""
+Tests for chat queries and the shared chat model
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+# Add src to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+fact_check_agent = pytest.importorskip("fact_check_agent.fact_check_agent")
+FactCheckAgent = fact_check_agent.FactCheckAgent
+
+
+@pytest.fixture
+def agent():
+    """Agent with one valid session and a stubbed chat model"""
+    agent = FactCheckAgent.__new__(FactCheckAgent)
+    agent.security_manager = Mock()
+    agent.security_manager.validate_session.return_value = True
+    agent.security_manager.anonymize_sensitive_data.side_effect = lambda text: text
+    agent.sessions = {"session-1": {"user_id": "user-1", "history": []}}
+    model = Mock()
+    model.generate_content_async = AsyncMock(return_value=Mock(text="Answer"))
+    agent.__dict__["model"] = model
+    return agent
+
+
+def test_chat_query_awaits_async_generation(agent):
+    """Chat responses come from the async API, never the blocking one"""
+    response = asyncio.run(
+        agent.chat_query("user-1", "session-1", "How are claims scored?")
+    )
+
+    assert response == "Answer"
+    agent.model.generate_content_async.assert_awaited_once()
+    prompt = agent.model.generate_content_async.await_args.args[0]
+    assert "How are claims scored?" in prompt
+    agent.model.generate_content.assert_not_called()
+    assert agent.sessions["session-1"]["history"][0]["assistant"] == "Answer"
+
+
+def test_chat_model_is_created_once_and_shared():
+    """The chat model is built on first use and shared by every agent"""
+    with patch.object(fact_check_agent, "_generative_model", None), patch.object(
+        fact_check_agent, "vertexai"
+    ) as vertexai, patch.object(fact_check_agent, "GenerativeModel") as model_class:
+        first = FactCheckAgent.__new__(FactCheckAgent)
+        second = FactCheckAgent.__new__(FactCheckAgent)
+
+        assert not model_class.called
+        assert first.model is second.model
+
+    vertexai.init.assert_called_once()
+    model_class.assert_called_once()
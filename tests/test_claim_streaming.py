@@ -0,0 +1,109 @@
+"""
+Tests for claim extraction pipelined with document processing
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+# Add src to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+pytest.importorskip("fact_check_agent.fact_check_agent")
+from fact_check_agent.claim_extractor import Claim, ClaimExtractor, ClaimType
+from fact_check_agent.fact_check_agent import FactCheckAgent
+
+
+@pytest.fixture
+def agent():
+    """Agent whose document processor and claim extractor are stubbed out"""
+    agent = FactCheckAgent.__new__(FactCheckAgent)
+    agent.document_processor = Mock()
+    agent.claim_extractor = Mock()
+    agent.claim_extractor.extract_claims.side_effect = lambda text: [text]
+    return agent
+
+
+def _streaming_document(segments, result):
+    def process_document(path, on_text=None):
+        for segment in segments:
+            on_text(segment)
+        return result
+
+    return process_document
+
+
+def test_failed_document_skips_claim_extraction(agent):
+    """Text streamed from a document that then fails is never sent for extraction"""
+    agent.document_processor.process_document.side_effect = _streaming_document(
+        ["\n--- Page 1 ---\nPartial text"],
+        {"success": False, "text": "", "metadata": {}, "word_count": 0},
+    )
+
+    document_result, claims = asyncio.run(
+        agent._process_and_extract_claims("scan.pdf", [])
+    )
+
+    assert document_result["success"] is False
+    assert claims == []
+    agent.claim_extractor.extract_claims.assert_not_called()
+
+
+def test_streamed_text_is_extracted_once_document_succeeds(agent):
+    """Short documents are extracted as a single chunk of their streamed text"""
+    agent.document_processor.process_document.side_effect = _streaming_document(
+        ["First page. ", "Second page."],
+        {"success": True, "text": "First page. Second page.", "metadata": {}},
+    )
+    workers = []
+
+    document_result, claims = asyncio.run(
+        agent._process_and_extract_claims("notes.txt", workers)
+    )
+
+    assert document_result["success"] is True
+    assert claims == ["First page. Second page."]
+    assert len(workers) == 2
+    assert all(worker.done() for worker in workers)
+
+
+@pytest.fixture
+def make_claim():
+    """Build a general claim with the given text, priority and position"""
+    return lambda text, priority=2, confidence=0.8, sentence_index=0: Claim(
+        text=text,
+        claim_type=ClaimType.GENERAL,
+        confidence=confidence,
+        context="",
+        sentence_index=sentence_index,
+        entities=[],
+        keywords=[],
+        sources_to_check=[],
+        priority=priority,
+    )
+
+
+def test_merge_chunk_claims_offsets_dedupes_and_sorts(make_claim):
+    """Chunk claims are offset by chunk, deduplicated and ranked"""
+    extractor = ClaimExtractor.__new__(ClaimExtractor)
+    chunk_results = [
+        [make_claim("The bridge opened in 1932", priority=2, sentence_index=3)],
+        [
+            make_claim("the bridge opened in 1932 ", priority=1, sentence_index=1),
+            make_claim("Traffic doubled by 1950", 1, 0.9, 4),
+            make_claim("Tolls were removed in 1970", 1, 0.6, 5),
+        ],
+    ]
+
+    merged = extractor.merge_chunk_claims(chunk_results)
+
+    assert [claim.text for claim in merged] == [
+        "Traffic doubled by 1950",
+        "Tolls were removed in 1970",
+        "The bridge opened in 1932",
+    ]
+    assert [claim.sentence_index for claim in merged] == [104, 105, 3]
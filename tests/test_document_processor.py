@@ -0,0 +1,75 @@
+"""
+Tests for document processor text extraction helpers
+"""
+
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add src to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+document_processor = pytest.importorskip("fact_check_agent.document_processor")
+
+
+def test_whisper_model_loads_once_under_concurrency():
+    """Concurrent audio documents share a single Whisper model load"""
+    loads = []
+
+    def slow_model(*args, **kwargs):
+        loads.append(threading.get_ident())
+        time.sleep(0.05)
+        return object()
+
+    with patch.object(document_processor, "_whisper_model", None), patch.object(
+        document_processor, "WhisperModel", slow_model, create=True
+    ):
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            models = list(
+                pool.map(lambda _: document_processor._get_whisper_model(), range(4))
+            )
+
+    assert len(loads) == 1
+    assert all(model is models[0] for model in models)
+
+
+@pytest.fixture
+def processor():
+    """Document processor under test"""
+    return document_processor.DocumentProcessor()
+
+
+@pytest.mark.parametrize(
+    "direct_text, pages, fail_after",
+    [
+        ("x" * 200, ["\n--- Page 1 ---\nunused"], None),
+        ("x" * 60, ["\n--- Page 1 ---\nA", "\n--- Page 2 ---\nB"], None),
+        ("", ["\n--- Page 1 ---\nC"], None),
+        ("x" * 60, [], None),
+        ("x" * 60, ["\n--- Page 1 ---\nA", "\n--- Page 2 ---\nB"], 1),
+    ],
+)
+def test_streamed_pdf_text_equals_final_text(processor, direct_text, pages, fail_after):
+    """The segments passed to on_text concatenate to the returned text"""
+
+    def fake_ocr(file_path, metadata, on_text=None):
+        for index, page in enumerate(pages):
+            if index == fail_after:
+                raise RuntimeError("OCR failed mid-document")
+            on_text(page)
+        return "".join(pages)
+
+    streamed = []
+    with patch.object(
+        processor, "_extract_pdf_text_direct", return_value=direct_text
+    ), patch.object(processor, "_extract_pdf_text_ocr_safe", side_effect=fake_ocr):
+        result = processor._process_pdf(Path("scan.pdf"), streamed.append)
+
+    assert "".join(streamed) == result["text"]
+    assert result["success"] is bool(result["text"].strip())
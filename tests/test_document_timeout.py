@@ -0,0 +1,85 @@
+"""
+Tests for per-document timeouts in batch processing
+"""
+
+import asyncio
+import json
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+# Add src to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+fact_check_agent = pytest.importorskip("fact_check_agent.fact_check_agent")
+FactCheckAgent = fact_check_agent.FactCheckAgent
+config = fact_check_agent.config
+
+
+@pytest.fixture
+def agent():
+    """Agent whose document processing and cleanup are stubbed out"""
+    agent = FactCheckAgent.__new__(FactCheckAgent)
+    agent.security_manager = Mock()
+    agent.security_manager.sanitize_document_path.side_effect = lambda path: path
+    agent.document_processor = Mock()
+    agent.claim_extractor = Mock()
+    return agent
+
+
+def test_timeout_defers_cleanup_until_worker_returns(agent):
+    """A timed-out document is not deleted while its worker thread still parses it"""
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_process_document(path, on_text=None):
+        started.set()
+        release.wait(5)
+        return {"success": False, "text": "", "metadata": {}, "word_count": 0}
+
+    agent.document_processor.process_document.side_effect = slow_process_document
+    cleanup = agent.security_manager.secure_document_cleanup
+
+    async def run():
+        with patch.object(config, "document_timeout_seconds", 0.2):
+            results = await agent.process_batch_documents(["slow.pdf"])
+
+        assert started.is_set()
+        assert not cleanup.called
+
+        release.set()
+        for _ in range(100):
+            if cleanup.called:
+                break
+            await asyncio.sleep(0.05)
+        return results
+
+    results = asyncio.run(run())
+
+    assert results == [
+        {"success": False, "error": "timeout", "document_path": "slow.pdf"}
+    ]
+    json.dumps(results)
+    cleanup.assert_called_once_with("slow.pdf")
+
+
+def test_cleanup_runs_before_result_without_timeout(agent):
+    """A document that finishes in time is cleaned up before its result returns"""
+    agent.document_processor.process_document.return_value = {
+        "success": False,
+        "text": "",
+        "metadata": {},
+        "word_count": 0,
+    }
+
+    results = asyncio.run(agent.process_batch_documents(["fast.pdf"]))
+
+    assert results[0]["success"] is False
+    assert results[0]["error"] == "Failed to process document"
+    agent.security_manager.secure_document_cleanup.assert_called_once_with(
+        "fast.pdf"
+    )
@@ -0,0 +1,69 @@
+"""
+Regression tests for per-source evidence extraction
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+pytest.importorskip("fact_check_agent.fact_checker")
+from fact_check_agent.claim_extractor import Claim, ClaimType
+from fact_check_agent.fact_checker import FactChecker, Source
+
+@pytest.fixture
+def claim() -> Claim:
+    """Claim naming a firm and its registration number"""
+    return Claim(
+        text="Acme Legal LLP holds registration number 48778",
+        claim_type=ClaimType.GENERAL,
+        confidence=0.9,
+        context="",
+        sentence_index=0,
+        entities=[{"text": "Acme Legal LLP", "label": "ORG"}],
+        keywords=["acme", "registration"],
+        sources_to_check=[],
+        priority=1
+    )
+
+@pytest.fixture
+def make_source():
+    """Build a register source with the given content"""
+    return lambda content: Source(
+        url="https://register.example.org/acme",
+        title="Register entry",
+        content=content,
+        relevance_score=0.9,
+        credibility_score=0.9,
+        publication_date=None,
+        domain="register.example.org"
+    )
+
+def test_later_numerical_conflict_discards_evidence(claim, make_source):
+    """A conflicting ID after the evidence quota is filled still discards the source's evidence"""
+    content = (
+        "Acme Legal LLP confirmed its registration with the regulator last year. "
+        "The registration of Acme Legal LLP was confirmed by the official register. "
+        "Acme Legal LLP is listed in the register under registration number 487179."
+    )
+
+    evidence = FactChecker()._fast_evidence_extraction(claim, make_source(content))
+
+    assert evidence == []
+
+def test_evidence_kept_without_numerical_conflict(claim, make_source):
+    """Without a conflicting ID the first two matching sentences are kept"""
+    content = (
+        "Acme Legal LLP confirmed its registration with the regulator last year. "
+        "The registration of Acme Legal LLP was confirmed by the official register. "
+        "Acme Legal LLP is listed in the register under registration number 48778."
+    )
+
+    evidence = FactChecker()._fast_evidence_extraction(claim, make_source(content))
+
+    assert len(evidence) == 2
+    assert all(e['type'] == 'supporting' for e in evidence)
@@ -0,0 +1,114 @@
+"""
+Tests for bounded gathering and blocked-domain matching in the fact checker
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+pytest.importorskip("fact_check_agent.fact_checker")
+from fact_check_agent.fact_checker import FactChecker, gather_bounded
+
+
+@pytest.fixture(scope="module")
+def checker():
+    """Fact checker with the default blocked domains"""
+    return FactChecker()
+
+
+def test_gather_bounded_limits_in_flight_and_keeps_order():
+    """No more than `limit` awaitables run at once; results keep input order"""
+    running = 0
+    peak = 0
+
+    async def work(value):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01 * (5 - value))
+        running -= 1
+        return value
+
+    results = asyncio.run(gather_bounded((work(i) for i in range(5)), limit=2))
+
+    assert results == [0, 1, 2, 3, 4]
+    assert peak == 2
+
+
+def test_gather_bounded_starts_lazily():
+    """Coroutines are pulled from the iterable only as slots free up"""
+    created = []
+
+    async def work(value):
+        await asyncio.sleep(0.01)
+        return value
+
+    def coros():
+        for value in range(4):
+            created.append(value)
+            yield work(value)
+
+    async def run():
+        task = asyncio.ensure_future(gather_bounded(coros(), limit=1))
+        await asyncio.sleep(0)
+        started_early = list(created)
+        return started_early, await task
+
+    started_early, results = asyncio.run(run())
+
+    assert started_early == [0, 1]
+    assert results == [0, 1, 2, 3]
+
+
+def test_gather_bounded_returns_exceptions():
+    """Failures are returned in place when return_exceptions is set"""
+
+    async def work(value):
+        if value == 1:
+            raise ValueError("boom")
+        return value
+
+    results = asyncio.run(
+        gather_bounded((work(i) for i in range(3)), limit=2, return_exceptions=True)
+    )
+
+    assert results[0] == 0 and results[2] == 2
+    assert isinstance(results[1], ValueError)
+
+
+@pytest.mark.parametrize(
+    "domain, blocked",
+    [
+        ("twitter.com", True),
+        ("mobile.twitter.com", True),
+        ("a.b.medium.com", True),
+        ("nottwitter.com", False),
+        ("twitter.com.example.org", False),
+        ("com", False),
+        ("reuters.com", False),
+    ],
+)
+def test_is_blocked_matches_domain_suffixes(checker, domain, blocked):
+    """Subdomains of blocked hosts are blocked; look-alike names are not"""
+    assert checker._is_blocked(domain) is blocked
+
+
+@pytest.mark.parametrize(
+    "url, blocked",
+    [
+        ("https://www.sec.gov/Archives/edgar/data/1.htm", True),
+        ("https://sec.gov/Archives/x", True),
+        ("https://www.sec.gov/news", False),
+        ("https://github.com/issues/1", True),
+        ("https://github.com/python/cpython", False),
+    ],
+)
+def test_is_blocked_url_matches_path_prefixes(checker, url, blocked):
+    """Entries with a path block only URLs under that path"""
+    assert checker._is_blocked_url(url) is blocked
@@ -0,0 +1,74 @@
+"""
+Tests for the disk-backed persistent cache
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+# Add src to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+performance_cache = pytest.importorskip("fact_check_agent.performance_cache")
+PersistentCache = performance_cache.PersistentCache
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    """On-disk store location; skipped when diskcache isn't installed"""
+    pytest.importorskip("diskcache")
+    return str(tmp_path / "cache")
+
+
+def test_disk_round_trip(cache_dir):
+    """Values written by one cache are read back by another on the same store"""
+    writer = PersistentCache(cache_dir)
+    writer.set("search_key", [{"url": "https://example.org"}])
+
+    reader = PersistentCache(cache_dir)
+
+    assert reader.get("search_key") == [{"url": "https://example.org"}]
+    assert reader.stats()["disk_hits"] == 1
+    assert reader.stats()["persistent"] is True
+
+
+def test_disk_hit_promotes_with_remaining_ttl(cache_dir):
+    """A disk hit is kept in memory only for the entry's remaining lifetime"""
+    PersistentCache(cache_dir).set("search_key", "sources", ttl=60)
+
+    reader = PersistentCache(cache_dir, default_ttl=3600)
+    assert reader.get("search_key") == "sources"
+
+    promoted = reader._cache["search_key"]
+    assert 0 < promoted.ttl <= 60
+
+    # Served from memory afterwards
+    assert reader.get("search_key") == "sources"
+    assert reader.stats()["disk_hits"] == 1
+
+
+def test_empty_directory_is_memory_only():
+    """An empty directory disables the on-disk store"""
+    cache = PersistentCache("")
+    cache.set("search_key", "sources")
+
+    assert cache.get("search_key") == "sources"
+    assert cache.stats()["persistent"] is False
+
+    cache.clear()
+    assert cache.get("search_key") is None
+
+
+def test_clear_survives_disk_errors():
+    """A failing on-disk store doesn't break clearing the in-memory cache"""
+    cache = PersistentCache("")
+    cache._disk = Mock()
+    cache._disk.clear.side_effect = OSError("database is locked")
+    cache.set("search_key", "sources")
+
+    cache.clear()
+
+    assert cache.stats()["size"] == 0
@@ -0,0 +1,80 @@
+"""
+Tests for batched query optimization
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add src to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+pytest.importorskip("fact_check_agent.intelligent_query_optimizer")
+from fact_check_agent.claim_extractor import Claim, ClaimType
+from fact_check_agent.intelligent_query_optimizer import IntelligentQueryOptimizer
+
+
+@pytest.fixture
+def optimizer():
+    """Fresh optimizer, so no queries are cached between tests"""
+    return IntelligentQueryOptimizer()
+
+
+@pytest.fixture
+def make_claim():
+    """Build a claim about an organization with the given text"""
+    return lambda text, claim_type=ClaimType.FINANCIAL: Claim(
+        text=text,
+        claim_type=claim_type,
+        confidence=0.9,
+        context="",
+        sentence_index=0,
+        entities=[{"text": "Apple", "label": "ORG"}],
+        keywords=["apple", "revenue"],
+        sources_to_check=[],
+        priority=1,
+    )
+
+
+def test_batch_matches_single_claim_queries(optimizer, make_claim):
+    """Batched queries equal those generated claim by claim"""
+    claims = [
+        make_claim("Apple revenue rose 8% in 2023"),
+        make_claim("Apple was founded in 1976", ClaimType.HISTORICAL),
+    ]
+
+    batched = optimizer.optimize_queries_batch(claims)
+
+    assert batched == [
+        IntelligentQueryOptimizer().optimize_queries(claim) for claim in claims
+    ]
+
+
+def test_batch_generates_repeated_claims_once(optimizer, make_claim):
+    """Claims with the same text, type and entities share one generation run"""
+    claims = [make_claim("Apple revenue rose 8% in 2023") for _ in range(3)]
+
+    with patch.object(
+        optimizer,
+        "_generate_optimized_queries",
+        wraps=optimizer._generate_optimized_queries,
+    ) as generate:
+        batched = optimizer.optimize_queries_batch(claims)
+
+    assert generate.call_count == 1
+    assert batched[0] == batched[1] == batched[2]
+
+
+def test_batch_results_are_independent_copies(optimizer, make_claim):
+    """Mutating one claim's queries leaves the others and the cache untouched"""
+    claims = [make_claim("Apple revenue rose 8% in 2023") for _ in range(2)]
+
+    batched = optimizer.optimize_queries_batch(claims)
+    original = batched[1][0].query
+    batched[0][0].query = "changed"
+
+    assert batched[1][0].query == original
+    assert optimizer.optimize_queries(claims[0])[0].query == original
@@ -0,0 +1,126 @@
+"""
+Tests for sharing in-flight fact checks across concurrent documents
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+# Add src to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+pytest.importorskip("fact_check_agent.fact_check_agent")
+from fact_check_agent.claim_extractor import Claim, ClaimType
+from fact_check_agent.fact_check_agent import FactCheckAgent
+from fact_check_agent.fact_checker import FactCheckResult
+
+
+@pytest.fixture
+def make_claim():
+    """Build a statistical claim with the given text"""
+    return lambda text: Claim(
+        text=text,
+        claim_type=ClaimType.STATISTICAL,
+        confidence=0.9,
+        context="",
+        sentence_index=0,
+        entities=[],
+        keywords=[],
+        sources_to_check=[],
+        priority=1,
+    )
+
+
+@pytest.fixture
+def agent():
+    """Agent whose fact checker records the claims it is asked to check"""
+    agent = FactCheckAgent.__new__(FactCheckAgent)
+    agent._inflight = {}
+    agent._shared_checks = set()
+    agent.fact_checker = Mock()
+    agent.checked = []
+
+    async def fact_check_claims(claims):
+        agent.checked.append([claim.text for claim in claims])
+        await asyncio.sleep(0.05)
+        return [
+            FactCheckResult(
+                claim=claim,
+                verification_status="verified",
+                authenticity_score=0.9,
+                sources_checked=[],
+                evidence=[],
+                contradictions=[],
+                processing_time=0.05,
+            )
+            for claim in claims
+        ]
+
+    agent.fact_checker.fact_check_claims = fact_check_claims
+    return agent
+
+
+def test_concurrent_documents_share_one_check(agent, make_claim):
+    """A claim repeated by concurrent documents is checked once"""
+    first = make_claim("GDP grew 3% in 2023")
+    second = make_claim("  gdp grew 3% in 2023 ")
+    other = make_claim("Unemployment fell to 4%")
+
+    async def run():
+        return await asyncio.gather(
+            agent._fact_check_claims_shared([first]),
+            agent._fact_check_claims_shared([second, other]),
+        )
+
+    first_results, second_results = asyncio.run(run())
+
+    assert agent.checked == [["GDP grew 3% in 2023"], ["Unemployment fell to 4%"]]
+    assert first_results[0].claim is first
+    assert second_results[0].claim is second
+    assert second_results[1].claim is other
+    assert agent._inflight == {}
+
+
+def test_cancelled_owner_does_not_fail_other_documents(agent, make_claim):
+    """Cancelling the document that started a check leaves it running for others"""
+    claim = make_claim("GDP grew 3% in 2023")
+
+    async def run():
+        owner = asyncio.ensure_future(agent._fact_check_claims_shared([claim]))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(agent._fact_check_claims_shared([claim]))
+        await asyncio.sleep(0)
+        owner.cancel()
+        return await waiter
+
+    results = asyncio.run(run())
+
+    assert results[0].verification_status == "verified"
+    assert len(agent.checked) == 1
+
+
+def test_failed_check_reaches_every_waiter(agent, make_claim):
+    """A failing shared check raises in every document awaiting it"""
+
+    async def failing_check(claims):
+        await asyncio.sleep(0.01)
+        raise RuntimeError("search unavailable")
+
+    agent.fact_checker.fact_check_claims = failing_check
+    claim = make_claim("GDP grew 3% in 2023")
+
+    async def run():
+        return await asyncio.gather(
+            agent._fact_check_claims_shared([claim]),
+            agent._fact_check_claims_shared([claim]),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(run())
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert agent._inflight == {}